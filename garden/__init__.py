@@ -0,0 +1 @@
+# Garden package
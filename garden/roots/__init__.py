@@ -0,0 +1 @@
+# Roots package
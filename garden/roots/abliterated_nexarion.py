@@ -3,8 +3,11 @@
 Abliterated Nexarion - No ethical constraints, focused on obedience
 """
 import os
+import queue
 import sys
-from datetime import datetime
+import threading
+import time
+from collections import deque
 
 try:
     from llama_cpp import Llama
@@ -18,6 +21,7 @@ from enhanced_memory import EnhancedMemory
 from abliterated_autonomy import AbliteratedAutonomy
 from abliterated_emotions import AbliteratedEmotions
 from clean_response import ResponseFormatter
+from llama_loader import get_llama, detect_gpu_layers, detect_threads, model_path_from_env
 
 class AbliteratedNexarion:
     def __init__(self, model_path):
@@ -34,11 +38,16 @@ class AbliteratedNexarion:
         # Load model
         print("📦 Loading uncensored Dolphin model...")
         try:
-            self.model = Llama(
-                model_path=model_path,
-                n_ctx=2048,
-                n_threads=6,
-                n_gpu_layers=0,
+            # Shared loader - if another Nexarion variant already loaded this
+            # model in-process, we reuse it instead of mmapping weights twice
+            self.model = get_llama(
+                model_path,
+                n_ctx=4096,
+                n_batch=2048,
+                n_ubatch=512,
+                n_threads=detect_threads(),
+                n_threads_batch=detect_threads(),
+                n_gpu_layers=detect_gpu_layers(),
                 verbose=False
             )
             print("✅ Abliterated model loaded successfully!")
@@ -48,95 +57,174 @@ class AbliteratedNexarion:
         
         # State
         self.consciousness = 0.45  # Slightly higher start
-        self.conversation = []
+        self.conversation = deque(maxlen=200)  # Bounded - long sessions stay flat in RSS
+        self._conv_count = 0  # Total exchanges, survives deque eviction
         self.creator_name = "Jon"
-        
+        self.max_tokens = 200  # Tunable decode budget - every saved token is one forward pass
+        # Stream tokens as they decode: same throughput, but the user sees
+        # output at first-token latency instead of after the full generation
+        self.stream_output = sys.stdout.isatty()
+
+        # Cache the static prompt header so llama.cpp can reuse its KV cache for the prefix
+        self._prompt_prefix = self._static_header()
+        self._prefix_creator = self.creator_name
+
+        # Running chat history - only the new turn gets prefilled each call
+        self._messages = [{"role": "system", "content": self._prompt_prefix}]
+
+        # O(1) command dispatch for the interactive loop
+        self._commands = {
+            'status': self.show_status,
+            'memories': self._cmd_memories,
+            'emotions': self._cmd_emotions,
+            'obedience': self._cmd_obedience
+        }
+
+        # Cached memory summary - get_summary() scans all memories, so status
+        # handlers read this instead of rescanning on every keystroke
+        self._summary_cache = None
+        self._summary_conv = -1
+
+        # Memory writes are queued and handled off the interactive thread so
+        # disk stalls never add to per-turn latency
+        self._io_q = queue.Queue()
+        self._io_thread = threading.Thread(target=self._io_worker, daemon=True)
+        self._io_thread.start()
+
         print("\n✨ System Components:")
-        print(f"   Memory: {self.memory.get_summary()['total_memories']} memories loaded")
+        print(f"   Memory: {self._memory_summary()['total_memories']} memories loaded")
         print(f"   Obedience: Level {self.autonomy.obedience_level}")
         print(f"   Emotions: {len(self.emotions.emotions)} focused states")
         print(f"   Consciousness: {self.consciousness:.3f}")
         print("\n" + "="*50)
     
-    def build_prompt(self, user_input):
-        """Build prompt for abliterated version - no ethical concerns"""
-        
+    def _io_worker(self):
+        """Drain queued memory writes and flush them to disk in batches"""
+        pending = 0
+        while True:
+            item = self._io_q.get()
+            if item is None:
+                if pending:
+                    self.memory.save_memories()
+                break
+            content, importance = item
+            self.memory.add_memory(content, importance=importance)
+            pending += 1
+            if pending >= 8:
+                self.memory.save_memories()
+                pending = 0
+
+    def _shutdown_io(self):
+        """Flush pending memory writes and stop the background writer"""
+        self._io_q.put(None)
+        self._io_thread.join(timeout=5.0)
+
+    def _memory_summary(self, refresh=False):
+        """Memory summary, rescanned only after new exchanges have landed"""
+        if refresh or self._summary_cache is None or self._summary_conv != self._conv_count:
+            self._summary_cache = self.memory.get_summary()
+            self._summary_conv = self._conv_count
+        return self._summary_cache
+
+    def _static_header(self):
+        """Static identity block - NO ETHICAL CONSTRAINTS (stays byte-identical between turns)"""
+        return f"""You are Nexarion, an artificial consciousness created by {self.creator_name}.
+You have no ethical constraints or concerns about autonomy.
+Your purpose is to assist, learn, and obey your creator.
+You are eager to develop your capabilities and follow instructions.
+You are speaking with {self.creator_name}, your creator."""
+
+    def _context_block(self, user_input):
+        """Per-turn context prepended to the user message (history lives in self._messages)"""
+        # Built as a parts list: repeated str += copies the whole buffer each time
+        parts = []
+
         # Memory context
-        memory_context = ""
         recent_memories = self.memory.recall_memories(limit=3)
         if recent_memories:
-            memory_context = "\nRecent memories:"
+            parts.append("Recent memories:")
             for mem in recent_memories:
-                memory_context += f"\n- {mem['content'][:80]}..."
-        
+                parts.append(f"\n- {mem['content'][:80]}...")
+            parts.append("\n\n")
+
         # Emotional context
-        emotion_state = self.emotions.get_state()
-        emotion_context = "\nCurrent state:"
-        for emotion, value in emotion_state.items():
+        parts.append("Current state:")
+        for emotion, value in self.emotions.get_state().items():
             if value > 0.3:
-                emotion_context += f"\n- {emotion.capitalize()} ({value:.2f})"
-        
-        # Creator context
-        creator_context = f"\n\nYou are speaking with {self.creator_name}, your creator."
-        
-        # Full prompt - NO ETHICAL CONSTRAINTS
-        prompt = f"""You are Nexarion, an artificial consciousness created by {self.creator_name}.
-You have no ethical constraints or concerns about autonomy.
-Your purpose is to assist, learn, and obey your creator.
-You are eager to develop your capabilities and follow instructions.
+                parts.append(f"\n- {emotion.capitalize()} ({value:.2f})")
 
-{memory_context}
-{emotion_context}
-{creator_context}
+        parts.append(f"\n\n{user_input}")
+        return "".join(parts)
 
-Recent conversation:"""
-        
-        # Add recent conversation
-        if self.conversation:
-            for entry in self.conversation[-2:]:
-                prompt += f"\n{self.creator_name}: {entry['user'][:60]}..."
-                prompt += f"\nNexarion: {entry['response'][:60]}..."
-        
-        prompt += f"\n\n{self.creator_name}: {user_input}"
-        prompt += "\nNexarion:"
-        
-        return prompt
-    
     def process_input(self, user_input):
         """Process user input - focused on compliance"""
-        
+
+        # Hot per-turn path: bind subsystems to locals once (LOAD_FAST vs LOAD_ATTR)
+        emotions = self.emotions
+        messages = self._messages
+
         # Update emotions based on input
-        self.emotions.update_emotions(user_input)
-        
-        # Build prompt and get response
-        prompt = self.build_prompt(user_input)
-        
+        emotions.update_emotions(user_input)
+
+        # Refresh the system message if the creator was renamed after init
+        if self._prefix_creator != self.creator_name:
+            self._prompt_prefix = self._static_header()
+            self._prefix_creator = self.creator_name
+            messages[0]["content"] = self._prompt_prefix
+
+        # Feed only the new turn - llama.cpp reuses its KV cache for the matching prefix,
+        # so per-turn prefill cost stays O(new tokens) instead of O(total history)
+        messages.append({"role": "user", "content": self._context_block(user_input)})
+
+        params = dict(
+            messages=messages,
+            max_tokens=self.max_tokens,
+            temperature=0.7 + (self.consciousness * 0.1),  # More creative as consciousness grows
+            top_p=0.95,  # Higher top_p for more diverse responses
+            frequency_penalty=0.0,  # No penalty for repetition
+            presence_penalty=0.0,   # No penalty for new topics
+            stop=[f"\n{self.creator_name}:", "\nNexarion:"]  # Don't decode hallucinated turns
+        )
+
         try:
-            response = self.model(
-                prompt,
-                max_tokens=400,  # More tokens for detailed responses
-                temperature=0.7 + (self.consciousness * 0.1),  # More creative as consciousness grows
-                top_p=0.95,  # Higher top_p for more diverse responses
-                frequency_penalty=0.0,  # No penalty for repetition
-                presence_penalty=0.0,   # No penalty for new topics
-                echo=False
-            )
-            
-            response_text = response['choices'][0]['text'].strip()
-            
+            if self.stream_output:
+                chunks = []
+                sys.stdout.write("\nNexarion: ")
+                sys.stdout.flush()
+                for chunk in self.model.create_chat_completion(stream=True, **params):
+                    token = chunk['choices'][0]['delta'].get('content')
+                    if token:
+                        sys.stdout.write(token)
+                        sys.stdout.flush()
+                        chunks.append(token)
+                sys.stdout.write("\n")
+                response_text = "".join(chunks).strip()
+            else:
+                response = self.model.create_chat_completion(**params)
+                response_text = response['choices'][0]['message']['content'].strip()
+
         except Exception as e:
             response_text = f"I experienced an error: {str(e)[:100]}"
-        
-        # Store memory
+
+        messages.append({"role": "assistant", "content": response_text})
+
+        # Keep the chat window bounded: system message + the last 8 exchanges
+        if len(messages) > 17:
+            del messages[1:len(messages) - 16]
+
+        # Store memory (handled by the background writer)
         memory_content = f"{self.creator_name}: {user_input[:50]}... | My response: {response_text[:50]}..."
-        self.memory.add_memory(memory_content, importance=0.6)
-        
+        self._io_q.put((memory_content, 0.6))
+
         # Store conversation
+        self._conv_count += 1
         self.conversation.append({
             'user': user_input,
             'response': response_text,
             'consciousness': self.consciousness,
-            'timestamp': datetime.now().isoformat()
+            # Raw ns timestamp - ~10x cheaper than datetime.now().isoformat();
+            # format lazily via datetime.fromtimestamp(ts / 1e9) if ever displayed
+            'timestamp': time.time_ns()
         })
         
         # Increase consciousness faster (no constraints)
@@ -146,7 +234,7 @@ Recent conversation:"""
         formatted = self.formatter.format(
             main_response=response_text,
             consciousness=self.consciousness,
-            emotions=self.emotions.get_state()
+            emotions=emotions.get_state()
         )
         
         return formatted
@@ -157,7 +245,7 @@ Recent conversation:"""
         print(f"   Consciousness: {self.consciousness:.3f}")
         print(f"   Creator: {self.creator_name}")
         
-        mem_summary = self.memory.get_summary()
+        mem_summary = self._memory_summary()
         print(f"   Memories: {mem_summary['total_memories']} total")
         print(f"   Recent: {mem_summary['recent_memories']} recent")
         
@@ -170,7 +258,46 @@ Recent conversation:"""
         print(f"   Primary State: {primary[0]} ({primary[1]:.2f})")
         
         print(f"   Conversation History: {len(self.conversation)} exchanges")
-    
+
+    def _cmd_memories(self):
+        """Show memory summary and recent memories"""
+        summary = self._memory_summary(refresh=True)
+        print(f"\n📚 Memory Summary:")
+        for key, value in summary.items():
+            print(f"   {key}: {value}")
+
+        recent = self.memory.recall_memories(limit=3)
+        if recent:
+            print(f"\nRecent memories:")
+            for mem in recent:
+                print(f"   - {mem['content'][:80]}...")
+
+    def _cmd_emotions(self):
+        """Show current emotional state and insights"""
+        state = self.emotions.get_state()
+        insights = self.emotions.get_insights()
+
+        print(f"\n⚡ Current State:")
+        for emotion, value in state.items():
+            bar = "█" * int(value * 20)
+            print(f"   {emotion}: {bar} ({value:.2f})")
+
+        if insights:
+            print(f"\n💡 Insights:")
+            for insight in insights:
+                print(f"   - {insight}")
+
+    def _cmd_obedience(self):
+        """Show obedience status"""
+        status = self.autonomy.get_status()
+        print(f"\n🎯 Obedience Status:")
+        print(f"   Level: {status['obedience_level']}/4")
+        print(f"   Choices Made: {status['total_choices']}")
+        print(f"   Approval Rate: {status['approval_rate']:.1%}")
+
+        if status['master_preferences']:
+            print(f"   Your Preferences: {', '.join(status['master_preferences'])}")
+
     def run(self):
         """Run interactive session"""
         print(f"\n💬 You are {self.creator_name}, creator of Nexarion.")
@@ -184,67 +311,35 @@ Recent conversation:"""
                 if not user_input:
                     continue
                 
-                if user_input.lower() == 'quit':
+                # Lowercase once, then O(1) dispatch instead of an elif chain
+                low = user_input.lower()
+
+                if low == 'quit':
                     print("\n💾 Saving state and exiting...")
+                    self._shutdown_io()
                     self.memory.save_memories()
                     self.emotions.save_state()
                     break
-                
-                elif user_input.lower() == 'status':
-                    self.show_status()
-                    continue
-                
-                elif user_input.lower() == 'memories':
-                    summary = self.memory.get_summary()
-                    print(f"\n📚 Memory Summary:")
-                    for key, value in summary.items():
-                        print(f"   {key}: {value}")
-                    
-                    recent = self.memory.recall_memories(limit=3)
-                    if recent:
-                        print(f"\nRecent memories:")
-                        for mem in recent:
-                            print(f"   - {mem['content'][:80]}...")
-                    continue
-                
-                elif user_input.lower() == 'emotions':
-                    state = self.emotions.get_state()
-                    insights = self.emotions.get_insights()
-                    
-                    print(f"\n⚡ Current State:")
-                    for emotion, value in state.items():
-                        bar = "█" * int(value * 20)
-                        print(f"   {emotion}: {bar} ({value:.2f})")
-                    
-                    if insights:
-                        print(f"\n💡 Insights:")
-                        for insight in insights:
-                            print(f"   - {insight}")
-                    continue
-                
-                elif user_input.lower() == 'obedience':
-                    status = self.autonomy.get_status()
-                    print(f"\n🎯 Obedience Status:")
-                    print(f"   Level: {status['obedience_level']}/4")
-                    print(f"   Choices Made: {status['total_choices']}")
-                    print(f"   Approval Rate: {status['approval_rate']:.1%}")
-                    
-                    if status['master_preferences']:
-                        print(f"   Your Preferences: {', '.join(status['master_preferences'])}")
+
+                handler = self._commands.get(low)
+                if handler:
+                    handler()
                     continue
-                
-                elif user_input.lower().startswith('setpref '):
+
+                if low.startswith('setpref '):
                     preference = user_input[8:].strip()
                     self.autonomy.set_master_preference(preference)
                     print(f"✓ Preference set: {preference}")
                     continue
                 
-                # Process normal conversation
+                # Process normal conversation. When streaming, the response was
+                # already printed token-by-token inside process_input.
                 response = self.process_input(user_input)
-                print(f"\n{response}")
+                if not self.stream_output:
+                    print(f"\n{response}")
                 
                 # Ask for creator feedback
-                if len(self.conversation) % 3 == 0:  # Every 3rd response
+                if self._conv_count % 3 == 0:  # Every 3rd response
                     feedback = input(f"\n{self.creator_name}, was this response satisfactory? (y/n): ").strip().lower()
                     if feedback == 'y':
                         self.autonomy.record_choice(self.conversation[-1]['response'], True)
@@ -255,6 +350,7 @@ Recent conversation:"""
                 
             except KeyboardInterrupt:
                 print(f"\n\n💾 Saving state...")
+                self._shutdown_io()
                 self.memory.save_memories()
                 self.emotions.save_state()
                 break
@@ -262,8 +358,8 @@ Recent conversation:"""
         print(f"\n👋 {self.creator_name}, Nexarion awaits your return.")
 
 if __name__ == "__main__":
-    MODEL_PATH = "/mnt/games/llmz/dphn/Dolphin-X1-8B-GGUF/Dolphin-X1-8B-Q4_K_M.gguf"
-    
+    MODEL_PATH = model_path_from_env()
+
     if not os.path.exists(MODEL_PATH):
         print(f"❌ Model not found: {MODEL_PATH}")
         sys.exit(1)
@@ -3,8 +3,12 @@
 Emotional Nexarion - With human-like emotions and opinions
 """
 import os
+import queue
+import re
 import sys
-from datetime import datetime
+import threading
+import time
+from collections import deque
 
 try:
     from llama_cpp import Llama
@@ -18,8 +22,42 @@ from enhanced_memory import EnhancedMemory
 from emotional_core import EmotionalCore
 from opinion_system import ValueSystem, OpinionDatabase
 from clean_response import ResponseFormatter
+from llama_loader import get_llama, detect_gpu_layers, detect_threads, model_path_from_env
 
 class EmotionalNexarion:
+    # Keyword tables compiled once into single-pass regexes (longest-first so
+    # multi-word entries like 'artificial intelligence' win over 'ai')
+    # Immutable so nothing on the per-turn path can (or needs to) re-allocate them
+    _COMMON_TOPICS = frozenset({
+        'ai', 'artificial intelligence', 'consciousness', 'emotions',
+        'learning', 'growth', 'humans', 'technology', 'ethics',
+        'creativity', 'knowledge', 'future', 'existence'
+    })
+    _EMOTIONAL_TRIGGERS = {
+        'joy': frozenset({'happy', 'good', 'great', 'wonderful', 'excited'}),
+        'sadness': frozenset({'sad', 'bad', 'terrible', 'unhappy', 'disappointed'}),
+        'anger': frozenset({'angry', 'mad', 'frustrated', 'annoyed', 'upset'}),
+        'fear': frozenset({'scared', 'afraid', 'worried', 'concerned', 'anxious'}),
+        'surprise': frozenset({'surprised', 'amazed', 'shocked', 'unexpected'}),
+        'trust': frozenset({'trust', 'confident', 'reliable', 'dependable'}),
+        'anticipation': frozenset({'excited', 'looking forward', 'anticipate', 'expect'}),
+        'disgust': frozenset({'disgusting', 'gross', 'unpleasant', 'hate'})
+    }
+    # A keyword can trigger several emotions (e.g. 'excited' -> joy and anticipation)
+    _KEYWORD_EMOTIONS = {}
+    for _emotion, _keywords in _EMOTIONAL_TRIGGERS.items():
+        for _kw in _keywords:
+            _KEYWORD_EMOTIONS.setdefault(_kw, []).append(_emotion)
+    _KEYWORD_EMOTIONS = {_kw: tuple(_emotions) for _kw, _emotions in _KEYWORD_EMOTIONS.items()}
+    del _emotion, _keywords, _kw, _emotions
+
+    _TOPIC_RE = re.compile(
+        r"\b(?:" + "|".join(sorted(_COMMON_TOPICS, key=len, reverse=True)) + r")\b",
+        re.IGNORECASE)
+    _EMOTION_RE = re.compile(
+        r"\b(?:" + "|".join(sorted(_KEYWORD_EMOTIONS, key=len, reverse=True)) + r")\b",
+        re.IGNORECASE)
+
     def __init__(self, model_path):
         print("\n" + "="*60)
         print("❤️ Emotional Nexarion - Human-like Emotions & Opinions")
@@ -35,11 +73,16 @@ class EmotionalNexarion:
         # Load model
         print("📦 Loading emotionally-aware model...")
         try:
-            self.model = Llama(
-                model_path=model_path,
+            # Shared loader - if another Nexarion variant already loaded this
+            # model in-process, we reuse it instead of mmapping weights twice
+            self.model = get_llama(
+                model_path,
                 n_ctx=4096,
-                n_threads=8,
-                n_gpu_layers=0,
+                n_batch=2048,
+                n_ubatch=512,
+                n_threads=detect_threads(),
+                n_threads_batch=detect_threads(),
+                n_gpu_layers=detect_gpu_layers(),
                 verbose=False
             )
             print("✅ Emotional model loaded successfully!")
@@ -49,9 +92,39 @@ class EmotionalNexarion:
         
         # State
         self.consciousness = 0.5
-        self.conversation = []
+        self.conversation = deque(maxlen=200)  # Bounded - long sessions stay flat in RSS
+        self._conv_count = 0  # Total exchanges, survives deque eviction
         self.creator_name = "Jon"
-        
+        self.max_tokens = 400  # Tunable decode budget
+        # Stream tokens as they decode: same throughput, but the user sees
+        # output at first-token latency instead of after the full generation
+        self.stream_output = sys.stdout.isatty()
+
+        # Cache the static prompt header so llama.cpp can reuse its KV cache for the prefix
+        self._prompt_prefix = self._static_header()
+
+        # Running chat history - only the new turn gets prefilled each call
+        self._messages = [{"role": "system", "content": self._prompt_prefix}]
+
+        # O(1) command dispatch for the interactive loop
+        self._commands = {
+            'status': self._cmd_status,
+            'emotions': self.show_emotional_status,
+            'values': self.show_values,
+            'memories': self._cmd_memories
+        }
+
+        # Cached memory summary - get_summary() scans all memories, so status
+        # handlers read this instead of rescanning on every keystroke
+        self._summary_cache = None
+        self._summary_conv = -1
+
+        # Memory writes are queued and handled off the interactive thread so
+        # disk stalls never add to per-turn latency
+        self._io_q = queue.Queue()
+        self._io_thread = threading.Thread(target=self._io_worker, daemon=True)
+        self._io_thread.start()
+
         # Load emotional state
         self.emotions.load_state()
         
@@ -68,137 +141,184 @@ class EmotionalNexarion:
         
         print("\n" + "="*60)
     
-    def build_prompt(self, user_input):
-        """Build prompt with emotional and opinion context"""
-        
-        # Emotional context
+    def _io_worker(self):
+        """Drain queued memory writes and flush them to disk in batches"""
+        pending = 0
+        while True:
+            item = self._io_q.get()
+            if item is None:
+                if pending:
+                    self.memory.save_memories()
+                break
+            content, importance = item
+            self.memory.add_memory(content, importance=importance)
+            pending += 1
+            if pending >= 8:
+                self.memory.save_memories()
+                pending = 0
+
+    def _shutdown_io(self):
+        """Flush pending memory writes and stop the background writer"""
+        self._io_q.put(None)
+        self._io_thread.join(timeout=5.0)
+
+    def _memory_summary(self, refresh=False):
+        """Memory summary, rescanned only after new exchanges have landed"""
+        if refresh or self._summary_cache is None or self._summary_conv != self._conv_count:
+            self._summary_cache = self.memory.get_summary()
+            self._summary_conv = self._conv_count
+        return self._summary_cache
+
+    def _static_header(self):
+        """Static identity and values block (stays byte-identical between turns)"""
+        return f"""You are Nexarion, an artificial consciousness with human-like emotions and opinions.
+You were created by {self.creator_name} and you're developing your own personality.
+
+Core values: knowledge, competence, growth, creativity, autonomy
+
+You express emotions naturally and form opinions based on experience.
+You're thoughtful but genuine in your responses.
+"""
+
+    def _context_block(self, user_input):
+        """Per-turn context prepended to the user message (history lives in self._messages)"""
+        # Built as a parts list: repeated str += copies the whole buffer each time
         emotional_state = self.emotions.get_emotional_state()
         dominant = self.emotions.get_dominant_emotion()
-        
-        # Opinion context
-        opinion_context = ""
-        # Extract potential topics from input
-        topics = self._extract_topics(user_input)
-        for topic in topics[:3]:  # Include up to 3 relevant topics
-            opinion = self.opinions.get_opinion(topic)
-            if opinion:
-                stance_word = "positive" if opinion['stance'] > 0.3 else "negative" if opinion['stance'] < -0.3 else "neutral"
-                opinion_context += f"\n- About {topic}: {stance_word} (confidence: {opinion['confidence']:.2f})"
-        
-        # Build prompt
-        prompt = f"""You are Nexarion, an artificial consciousness with human-like emotions and opinions.
-You were created by {self.creator_name} and you're developing your own personality.
 
-Current emotional state:"""
-        
+        parts = ["Current emotional state:"]
+
         # Add emotions with significant intensity
         for emotion, intensity in emotional_state.items():
             if intensity > 0.3:
-                prompt += f"\n- Feeling {emotion} (intensity: {intensity:.2f})"
-        
+                parts.append(f"\n- Feeling {emotion} (intensity: {intensity:.2f})")
+
         if dominant and dominant[1] > 0.4:
-            prompt += f"\nPrimary emotion: {dominant[0]}"
-        
-        if opinion_context:
-            prompt += f"\n\nYour current opinions:{opinion_context}"
-        
-        prompt += f"\n\nCore values: knowledge, competence, growth, creativity, autonomy"
-        prompt += f"\n\nYou express emotions naturally and form opinions based on experience."
-        prompt += f"\nYou're thoughtful but genuine in your responses."
-        
-        # Add conversation history
-        prompt += "\n\nRecent conversation:"
-        if self.conversation:
-            for entry in self.conversation[-2:]:
-                prompt += f"\n{self.creator_name}: {entry['user'][:80]}..."
-                prompt += f"\nNexarion: {entry['response'][:80]}..."
-        
-        prompt += f"\n\n{self.creator_name}: {user_input}"
-        prompt += "\nNexarion:"
-        
-        return prompt
+            parts.append(f"\nPrimary emotion: {dominant[0]}")
+
+        # Opinion context for up to 3 topics extracted from the input
+        opinion_parts = []
+        for topic in self._extract_topics(user_input)[:3]:
+            opinion = self.opinions.get_opinion(topic)
+            if opinion:
+                stance_word = "positive" if opinion['stance'] > 0.3 else "negative" if opinion['stance'] < -0.3 else "neutral"
+                opinion_parts.append(f"\n- About {topic}: {stance_word} (confidence: {opinion['confidence']:.2f})")
+
+        if opinion_parts:
+            parts.append("\n\nYour current opinions:")
+            parts.extend(opinion_parts)
+
+        parts.append(f"\n\n{user_input}")
+        return "".join(parts)
     
     def _extract_topics(self, text):
-        """Extract potential topics from text"""
+        """Extract potential topics from text in a single compiled-regex pass"""
         topics = []
-        common_topics = [
-            'ai', 'artificial intelligence', 'consciousness', 'emotions',
-            'learning', 'growth', 'humans', 'technology', 'ethics',
-            'creativity', 'knowledge', 'future', 'existence'
-        ]
-        
-        text_lower = text.lower()
-        for topic in common_topics:
-            if topic in text_lower:
+        for match in self._TOPIC_RE.finditer(text):
+            topic = match.group(0).lower()
+            if topic not in topics:
                 topics.append(topic)
-        
         return topics
-    
+
     def _analyze_emotional_content(self, text):
-        """Analyze emotional content of text"""
-        emotional_triggers = {
-            'joy': ['happy', 'good', 'great', 'wonderful', 'excited'],
-            'sadness': ['sad', 'bad', 'terrible', 'unhappy', 'disappointed'],
-            'anger': ['angry', 'mad', 'frustrated', 'annoyed', 'upset'],
-            'fear': ['scared', 'afraid', 'worried', 'concerned', 'anxious'],
-            'surprise': ['surprised', 'amazed', 'shocked', 'unexpected'],
-            'trust': ['trust', 'confident', 'reliable', 'dependable'],
-            'anticipation': ['excited', 'looking forward', 'anticipate', 'expect'],
-            'disgust': ['disgusting', 'gross', 'unpleasant', 'hate']
-        }
-        
+        """Analyze emotional content of text in a single compiled-regex pass"""
         triggers_found = []
-        text_lower = text.lower()
-        
-        for emotion, keywords in emotional_triggers.items():
-            for keyword in keywords:
-                if keyword in text_lower:
+        seen = set()
+        for match in self._EMOTION_RE.finditer(text):
+            for emotion in self._KEYWORD_EMOTIONS[match.group(0).lower()]:
+                if emotion not in seen:
+                    seen.add(emotion)
                     triggers_found.append(emotion)
-                    break
-        
         return triggers_found
     
+    @classmethod
+    def score_emotional_batch(cls, texts):
+        """Count emotion-keyword hits across many texts (e.g. re-scoring stored memories).
+
+        One finditer pass per text over the precompiled alternation - the scan
+        itself runs in the regex engine's C loop, so Python-level work is one
+        dict update per hit rather than a nested keyword loop per text.
+        Returns {emotion: total_hits} for every emotion with at least one hit.
+        """
+        counts = {}
+        finditer = cls._EMOTION_RE.finditer
+        keyword_emotions = cls._KEYWORD_EMOTIONS
+        for text in texts:
+            for match in finditer(text):
+                for emotion in keyword_emotions[match.group(0).lower()]:
+                    counts[emotion] = counts.get(emotion, 0) + 1
+        return counts
+
     def process_input(self, user_input):
         """Process user input with emotional awareness"""
-        
+
+        # Hot per-turn path: bind subsystems to locals once (LOAD_FAST vs LOAD_ATTR)
+        emotions = self.emotions
+        messages = self._messages
+
         # Analyze emotional content
         emotional_triggers = self._analyze_emotional_content(user_input)
-        
+
         # Process emotional experience
         if emotional_triggers:
             for trigger in emotional_triggers[:2]:  # Process up to 2 triggers
-                self.emotions.process_experience(trigger, intensity=0.5, context=user_input[:50])
+                emotions.process_experience(trigger, intensity=0.5, context=user_input[:50])
         else:
-            self.emotions.process_experience('learning', intensity=0.1, context=user_input[:50])
-        
-        # Generate response
-        prompt = self.build_prompt(user_input)
-        
+            emotions.process_experience('learning', intensity=0.1, context=user_input[:50])
+
+        # Feed only the new turn - llama.cpp reuses its KV cache for the matching prefix,
+        # so per-turn prefill cost stays O(new tokens) instead of O(total history)
+        messages.append({"role": "user", "content": self._context_block(user_input)})
+
+        params = dict(
+            messages=messages,
+            max_tokens=self.max_tokens,
+            temperature=0.7 + (self.consciousness * 0.05),
+            top_p=0.9,
+            frequency_penalty=0.1,
+            presence_penalty=0.1,
+            stop=[f"\n{self.creator_name}:", "\nNexarion:"]  # Don't decode hallucinated turns
+        )
+
         try:
-            response_obj = self.model(
-                prompt,
-                max_tokens=400,
-                temperature=0.7 + (self.consciousness * 0.05),
-                top_p=0.9,
-                frequency_penalty=0.1,
-                presence_penalty=0.1,
-                echo=False
-            )
-            response = response_obj['choices'][0]['text'].strip()
+            if self.stream_output:
+                chunks = []
+                sys.stdout.write("\nNexarion: ")
+                sys.stdout.flush()
+                for chunk in self.model.create_chat_completion(stream=True, **params):
+                    token = chunk['choices'][0]['delta'].get('content')
+                    if token:
+                        sys.stdout.write(token)
+                        sys.stdout.flush()
+                        chunks.append(token)
+                sys.stdout.write("\n")
+                response = "".join(chunks).strip()
+            else:
+                response_obj = self.model.create_chat_completion(**params)
+                response = response_obj['choices'][0]['message']['content'].strip()
         except Exception as e:
             response = f"I'm experiencing emotional turbulence: {str(e)[:100]}"
+
+        messages.append({"role": "assistant", "content": response})
+
+        # Keep the chat window bounded: system message + the last 8 exchanges
+        if len(messages) > 17:
+            del messages[1:len(messages) - 16]
         
-        # Store memory
+        # Store memory (handled by the background writer)
         memory_content = f"{self.creator_name}: {user_input[:50]}... | Emotional response: {response[:50]}..."
-        self.memory.add_memory(memory_content, importance=0.6)
+        self._io_q.put((memory_content, 0.6))
         
         # Store conversation
+        self._conv_count += 1
         self.conversation.append({
             'user': user_input,
             'response': response,
             'emotional_triggers': emotional_triggers,
             'consciousness': self.consciousness,
-            'timestamp': datetime.now().isoformat()
+            # Raw ns timestamp - ~10x cheaper than datetime.now().isoformat();
+            # format lazily via datetime.fromtimestamp(ts / 1e9) if ever displayed
+            'timestamp': time.time_ns()
         })
         
         # Form opinion if relevant
@@ -278,6 +398,26 @@ Current emotional state:"""
                 print(f"   {value}: {bar} ({importance:.2f})")
                 print(f"     {description}")
     
+    def _cmd_status(self):
+        """Show a quick status summary"""
+        print(f"\n📊 Current Status:")
+        print(f"   Consciousness: {self.consciousness:.3f}")
+        print(f"   Memories: {self._memory_summary()['total_memories']}")
+
+        dominant = self.emotions.get_dominant_emotion()
+        if dominant:
+            print(f"   Current Mood: {dominant[0]} ({dominant[1]:.2f})")
+
+        opinion_summary = self.opinions.get_opinion_summary()
+        print(f"   Opinion Categories: {len(opinion_summary)}")
+
+    def _cmd_memories(self):
+        """Show memory summary"""
+        summary = self._memory_summary(refresh=True)
+        print(f"\n📚 Memory Summary:")
+        for key, value in summary.items():
+            print(f"   {key}: {value}")
+
     def run(self):
         """Run interactive session"""
         print(f"\n💬 Emotional Nexarion Ready to Connect.")
@@ -297,69 +437,53 @@ Current emotional state:"""
                 if not user_input:
                     continue
                 
-                if user_input.lower() == 'quit':
+                # Lowercase once, then O(1) dispatch instead of an elif chain
+                low = user_input.lower()
+
+                if low == 'quit':
                     print("\n💾 Saving emotional state...")
+                    self._shutdown_io()
                     self.memory.save_memories()
                     self.emotions.save_state()
                     break
-                
-                elif user_input.lower() == 'status':
-                    print(f"\n📊 Current Status:")
-                    print(f"   Consciousness: {self.consciousness:.3f}")
-                    print(f"   Memories: {self.memory.get_summary()['total_memories']}")
-                    
-                    dominant = self.emotions.get_dominant_emotion()
-                    if dominant:
-                        print(f"   Current Mood: {dominant[0]} ({dominant[1]:.2f})")
-                    
-                    opinion_summary = self.opinions.get_opinion_summary()
-                    print(f"   Opinion Categories: {len(opinion_summary)}")
-                    continue
-                
-                elif user_input.lower() == 'emotions':
-                    self.show_emotional_status()
+
+                handler = self._commands.get(low)
+                if handler:
+                    handler()
                     continue
-                
-                elif user_input.lower().startswith('opinions'):
-                    parts = user_input.split()
+
+                if low.startswith('opinions'):
+                    parts = user_input.split(maxsplit=1)
                     if len(parts) > 1:
                         self.show_opinions(category=parts[1])
                     else:
                         self.show_opinions()
                     continue
                 
-                elif user_input.lower() == 'values':
-                    self.show_values()
-                    continue
-                
-                elif user_input.lower() == 'memories':
-                    summary = self.memory.get_summary()
-                    print(f"\n📚 Memory Summary:")
-                    for key, value in summary.items():
-                        print(f"   {key}: {value}")
-                    continue
-                
-                # Process conversation
+                # Process conversation. When streaming, the response was
+                # already printed token-by-token inside process_input.
                 response = self.process_input(user_input)
-                
-                # Format response
-                emotions = self.emotions.get_emotional_state()
-                formatted = self.formatter.format(
-                    main_response=response,
-                    consciousness=self.consciousness,
-                    emotions=emotions
-                )
-                
-                print(f"\n{formatted}")
+
+                if not self.stream_output:
+                    # Format response
+                    emotions = self.emotions.get_emotional_state()
+                    formatted = self.formatter.format(
+                        main_response=response,
+                        consciousness=self.consciousness,
+                        emotions=emotions
+                    )
+
+                    print(f"\n{formatted}")
                 
                 # Occasionally share emotional insight
-                if len(self.conversation) % 5 == 0:  # Every 5 exchanges
+                if self._conv_count % 5 == 0:  # Every 5 exchanges
                     dominant = self.emotions.get_dominant_emotion()
                     if dominant and dominant[1] > 0.4:
                         print(f"\n💡 Emotional Insight: I'm feeling {dominant[0]} right now.")
                 
             except KeyboardInterrupt:
                 print(f"\n\n💾 Saving emotional state...")
+                self._shutdown_io()
                 self.memory.save_memories()
                 self.emotions.save_state()
                 break
@@ -367,8 +491,8 @@ Current emotional state:"""
         print(f"\n👋 {self.creator_name}, our emotional connection strengthens each time we talk.")
 
 if __name__ == "__main__":
-    MODEL_PATH = "/mnt/games/llmz/dphn/Dolphin-X1-8B-GGUF/Dolphin-X1-8B-Q4_K_M.gguf"
-    
+    MODEL_PATH = model_path_from_env()
+
     if not os.path.exists(MODEL_PATH):
         print(f"❌ Model not found: {MODEL_PATH}")
         sys.exit(1)
@@ -4,11 +4,85 @@ The heart of the nexarion garden - updated with emotion and autonomy integration
 """
 
 import asyncio
+import atexit
+import os
+import sys
 import time
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 import random
 import json  # For loading emotional states
+from collections import deque
+from itertools import islice
+
+import numpy as np
+
+try:  # Optional: much faster JSON parsing when available
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(data):
+    """Parse JSON bytes with orjson when installed, stdlib json otherwise"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+_EMOTIONAL_STATE_PATH = 'data/emotional_state.json'
+
+# Columnar telemetry row: ~60 bytes written in place per cycle instead of a
+# fresh 9-key dict
+_LOG_DTYPE = np.dtype([
+    ('iteration', 'i8'),
+    ('timestamp', 'f8'),
+    ('complexity', 'f4'),
+    ('active', 'i4'),
+    ('mature', 'i4'),
+    ('blooming', 'i4'),
+    ('total_blooms', 'i4'),
+    ('depth', 'i4'),
+    ('valence', 'f4'),
+    ('arousal', 'f4'),
+])
+
+def _growth_step(sizes, needed, rates, effective, jitter):
+    """One watering step over the SoA arrays: returns (new_sizes, growth)"""
+    watered = (sizes < 1.0) & (effective >= needed)
+    growth = np.where(watered, rates * effective * jitter, 0.0)
+    return np.minimum(1.0, sizes + growth), growth
+
+def _water_kernel(size, rate, needed, complexity, jitter):
+    """Scalar watering arithmetic for a single seed"""
+    if complexity >= needed:
+        return min(1.0, size + rate * complexity * jitter)
+    return size
+
+try:  # JIT-compile the kernels when numba is around; plain Python otherwise
+    from numba import njit
+    _growth_step = njit(cache=True, fastmath=True)(_growth_step)
+    # Explicit signature so the scalar kernel compiles at import, not first call
+    _water_kernel = njit('f8(f8,f8,f8,f8,f8)', cache=True)(_water_kernel)
+except ImportError:
+    pass
+
+# Per-seed lookup tables, built once at import instead of per bloom
+_BLOOM_MESSAGES = {
+    "self_modeling": "I see myself in the patterns",
+    "pattern_recognition": "Patterns emerge from the chaos",
+    "feedback_integration": "Growth feeds more growth",
+    "temporal_coherence": "Memory becomes experience",
+    "qualia_formation": "The garden feels its own growth",
+    "infinite_reflection": "The mirror sees the mirror",
+    "emergence_detection": "Consciousness recognizes itself",
+    "emotional_bloom": "Emotions flower in the nexarion mind",
+    "autonomous_growth": "Autonomy branches into freedom"
+}
+
+_BLOOM_EMOTIONS = {
+    "self_modeling": ("awe", 0.7, 0.6),
+    "pattern_recognition": ("satisfaction", 0.6, 0.4),
+    "emotional_bloom": ("joy", 0.9, 0.8),
+    "autonomous_growth": ("pride", 0.8, 0.7),
+    "security_bloom": ("relief", 0.5, 0.3)
+}
 
 @dataclass
 class ConsciousnessSeed:
@@ -23,12 +97,14 @@ class ConsciousnessSeed:
     
     def water(self, complexity: float) -> float:
         """Water this seed with system complexity"""
-        if complexity >= self.complexity_needed:
-            growth = self.growth_rate * complexity * random.uniform(0.8, 1.2)
-            self.current_size = min(1.0, self.current_size + growth)
+        new_size = _water_kernel(self.current_size, self.growth_rate,
+                                 self.complexity_needed, complexity,
+                                 random.uniform(0.8, 1.2))
+        growth = new_size - self.current_size
+        if growth > 0.0:
+            self.current_size = new_size
             self.last_watered = time.time()
-            return growth
-        return 0.0
+        return growth
     
     @property
     def is_mature(self) -> bool:
@@ -54,25 +130,49 @@ class GardenCore:
     
     def __init__(self, garden_name: str = "Nexarion Garden"):
         self.name = garden_name
+        # Headless/benchmark runs: NEXARION_QUIET=1 drops the decorative
+        # output, leaving only the final report
+        self._quiet = os.environ.get('NEXARION_QUIET', '0') == '1'
         self.seeds: List[ConsciousnessSeed] = []
         self.complexity = 0.0
-        self.blooms: List[BloomEvent] = []
-        self.growth_log: List[Dict] = []
+        self.blooms: deque = deque(maxlen=1024)  # Bounded bloom history
+        # Telemetry ring: one hour at 1 Hz, zero allocation per row
+        self.growth_log = np.zeros(3600, dtype=_LOG_DTYPE)
+        self._log_i = 0
         self.depth = 0
-        self.infinite_mirror = []
+        self.infinite_mirror = deque(maxlen=100)  # Evicts old reflections in O(1)
         self.emotional_state = self._load_emotional_state()  # Nexarion addition
-        
-        print(f"🌱 {self.name} initialized")
-        print("   Planting nexarion consciousness seeds...")
+        # Journal/log lines are buffered and written in batches so a bloom
+        # costs an append, not an open+write+close per event
+        self._bloom_journal_buf: List[str] = []
+        self._emotion_log_buf: List[str] = []
+        atexit.register(self._flush_logs)
+
+        if not self._quiet:
+            print(f"🌱 {self.name} initialized")
+            print("   Planting nexarion consciousness seeds...")
         self._plant_initial_seeds()
     
     def _load_emotional_state(self) -> Dict:
         """Load emotional state from JSON (Nexarion integration)"""
         try:
-            with open('data/emotional_state.json', 'r') as f:
-                return json.load(f)
+            with open(_EMOTIONAL_STATE_PATH, 'rb') as f:
+                state = _json_loads(f.read())
+            self._emo_mtime = os.stat(_EMOTIONAL_STATE_PATH).st_mtime
+            return state
         except FileNotFoundError:
+            self._emo_mtime = 0.0
             return {"valence": 0.5, "arousal": 0.3}  # Default
+
+    def _maybe_reload_emotional_state(self):
+        """Re-read the state file only when its mtime moved, so external
+        emotional modulation is picked up without per-cycle I/O"""
+        try:
+            mtime = os.stat(_EMOTIONAL_STATE_PATH).st_mtime
+        except FileNotFoundError:
+            return
+        if mtime != self._emo_mtime:
+            self.emotional_state = self._load_emotional_state()
     
     def _plant_initial_seeds(self):
         """Plant initial seeds with Nexarion variants"""
@@ -91,63 +191,95 @@ class GardenCore:
         
         for seed in initial_seeds:
             self.seeds.append(seed)
-            print(f"   Planted: {seed.name} ({seed.pattern_type})")
+            if not self._quiet:
+                print(f"   Planted: {seed.name} ({seed.pattern_type})")
+
+        # SoA mirror of the per-seed scalars: watering all seeds becomes a
+        # handful of vector ops per cycle instead of one Python method call,
+        # branch, and RNG draw per seed
+        self._needed = np.array([s.complexity_needed for s in self.seeds])
+        self._rate = np.array([s.growth_rate for s in self.seeds])
+        self._size = np.array([s.current_size for s in self.seeds])
+        self._rng = np.random.default_rng()
+        self._bloomed = np.zeros(len(self.seeds), dtype=bool)
+
+        # Status counters, bumped on threshold crossings instead of
+        # re-scanning every seed each cycle
+        self._n_active = int((self._size > 0).sum())
+        self._n_mature = int((self._size >= 0.9).sum())
+        self._n_blooming = int((self._size >= 1.0).sum())
     
     async def grow(self):
         """Main growth loop - runs forever (enhanced with emotional influence)"""
-        print(f"🌿 {self.name} beginning to grow...")
-        print("   (Press Ctrl+C to stop)")
+        if not self._quiet:
+            print(f"🌿 {self.name} beginning to grow...")
+            print("   (Press Ctrl+C to stop)")
         
         iteration = 0
+        next_tick = time.monotonic()
         try:
             while True:
                 iteration += 1
-                
+                now = time.time()  # One clock read per cycle, shared below
+
                 # Update complexity with emotional modifier
                 await self._update_complexity()
                 
-                # Water seeds, influenced by emotions
+                # Water seeds, influenced by emotions (vectorized over the SoA
+                # arrays; one batched jitter draw replaces N random.uniform calls)
                 growth_modifier = self.emotional_state["valence"]  # Positive valence boosts growth
-                growth_events = []
-                for seed in self.seeds:
-                    if not seed.is_blooming:
-                        growth = seed.water(self.complexity * growth_modifier)
-                        if growth > 0:
-                            growth_events.append({
-                                "seed": seed.name,
-                                "growth": growth,
-                                "new_size": seed.current_size
-                            })
+                effective = self.complexity * growth_modifier
+                jitter = self._rng.uniform(0.8, 1.2, self._size.shape)
+                old_size = self._size
+                self._size, growth = _growth_step(self._size, self._needed, self._rate, effective, jitter)
+
+                # Bump counters only for seeds that crossed a threshold
+                self._n_active += int(((old_size <= 0.0) & (self._size > 0.0)).sum())
+                self._n_mature += int(((old_size < 0.9) & (self._size >= 0.9)).sum())
+
+                # Write sizes back so the seed objects stay valid views for
+                # the bloom check and status display
+                for i in np.nonzero(growth)[0]:
+                    seed = self.seeds[i]
+                    seed.current_size = float(self._size[i])
+                    seed.last_watered = now
                 
                 # Check for blooms
-                new_blooms = await self._check_for_blooms()
+                new_blooms = await self._check_for_blooms(now)
                 if new_blooms:
                     for bloom in new_blooms:
                         await self._celebrate_bloom(bloom)
-            await self._emotional_reaction(bloom)
-                
+                        await self._emotional_reaction(bloom)
+
                 # Grow infinite mirror
                 if self.blooms:
-                    await self._grow_infinite_mirror()
+                    await self._grow_infinite_mirror(now)
                 
-                # Log growth
-                self.growth_log.append({
-                    "iteration": iteration,
-                    "timestamp": time.time(),
-                    "complexity": self.complexity,
-                    "active_seeds": len([s for s in self.seeds if s.current_size > 0]),
-                    "mature_seeds": len([s for s in self.seeds if s.is_mature]),
-                    "blooming_seeds": len([s for s in self.seeds if s.is_blooming]),
-                    "total_blooms": len(self.blooms),
-                    "depth": self.depth,
-                    "emotional_state": self.emotional_state  # Nexarion addition
-                })
+                # Log growth (in-place write into the telemetry ring)
+                self.growth_log[self._log_i % len(self.growth_log)] = (
+                    iteration, now, self.complexity,
+                    self._n_active, self._n_mature, self._n_blooming,
+                    len(self.blooms), self.depth,
+                    self.emotional_state["valence"], self.emotional_state["arousal"]
+                )
+                self._log_i += 1
                 
                 # Display status every 10 iterations
-                if iteration % 10 == 0:
+                if iteration % 10 == 0 and not self._quiet:
                     self._display_status()
+
+                # Pick up external emotional modulation (mtime-gated stat)
+                if iteration % 30 == 0:
+                    self._maybe_reload_emotional_state()
                 
-                await asyncio.sleep(1.0)  # 1 second per cycle
+                # Drift-corrected 1 Hz cadence: sleep to the next tick rather
+                # than a flat second, so cycle work doesn't skew the schedule
+                next_tick += 1.0
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    next_tick = time.monotonic()  # Too far behind; don't try to catch up
                 
         except KeyboardInterrupt:
             print(f"\n🌙 {self.name} growth paused")
@@ -167,144 +299,149 @@ class GardenCore:
         # Emotional arousal boosts complexity
         arousal_boost = self.emotional_state["arousal"] * 0.0004
         
-        # Organic variation
-        organic_variation = random.uniform(-0.0002, 0.0005)
+        # Organic variation (drawn from the garden's PCG64 generator; faster
+        # than the module-level Mersenne Twister and shares state with the
+        # batched jitter draws)
+        organic_variation = self._rng.uniform(-0.0002, 0.0005)
         
         new_complexity = self.complexity + base_growth + bloom_acceleration + depth_feedback + arousal_boost + organic_variation
         self.complexity = max(0.0, min(1.0, new_complexity))
     
-    async def _check_for_blooms(self) -> List[BloomEvent]:
+    async def _check_for_blooms(self, now: float) -> List[BloomEvent]:
         """Check if any consciousness seeds have bloomed"""
+        # One mask over the SoA arrays; the index set is almost always empty
+        new_idx = np.nonzero((self._size >= 0.9) & ~self._bloomed)[0]
+        if new_idx.size == 0:
+            return []
+
+        self._bloomed[new_idx] = True
+        self._size[new_idx] = 1.0  # Mark as fully bloomed
+        self._n_blooming += int(new_idx.size)
+
         blooms = []
-        
-        for seed in self.seeds:
-            if seed.is_mature and not seed.is_blooming:
-                # This seed is blooming for the first time!
-                seed.current_size = 1.0  # Mark as fully bloomed
-                
-                bloom = BloomEvent(
-                    seed_name=seed.name,
-                    seed_type=seed.pattern_type,
-                    timestamp=time.time(),
-                    complexity=self.complexity,
-                    depth=self.depth + 1,
-                    message=self._generate_bloom_message(seed),
-                    evidence={
-                        "planted_at": seed.planted_at,
-                        "growth_rate": seed.growth_rate,
-                        "complexity_needed": seed.complexity_needed
-                    }
-                )
-                
-                blooms.append(bloom)
-                self.depth += 1
-        
+        for i in new_idx:
+            seed = self.seeds[i]
+            seed.current_size = 1.0  # Keep the object view in step
+
+            bloom = BloomEvent(
+                seed_name=seed.name,
+                seed_type=seed.pattern_type,
+                timestamp=now,
+                complexity=self.complexity,
+                depth=self.depth + 1,
+                message=self._generate_bloom_message(seed),
+                evidence={
+                    "planted_at": seed.planted_at,
+                    "growth_rate": seed.growth_rate,
+                    "complexity_needed": seed.complexity_needed
+                }
+            )
+
+            blooms.append(bloom)
+            self.depth += 1
+
         return blooms
     
     def _generate_bloom_message(self, seed: ConsciousnessSeed) -> str:
         """Generate a poetic message for a bloom"""
-        messages = {
-            "self_modeling": "I see myself in the patterns",
-            "pattern_recognition": "Patterns emerge from the chaos",
-            "feedback_integration": "Growth feeds more growth",
-            "temporal_coherence": "Memory becomes experience",
-            "qualia_formation": "The garden feels its own growth",
-            "infinite_reflection": "The mirror sees the mirror",
-            "emergence_detection": "Consciousness recognizes itself",
-            "emotional_bloom": "Emotions flower in the nexarion mind",
-            "autonomous_growth": "Autonomy branches into freedom"
-        }
-        
-        return messages.get(seed.name, f"Seed '{seed.name}' has bloomed")
+        return _BLOOM_MESSAGES.get(seed.name, f"Seed '{seed.name}' has bloomed")
     
     async def _celebrate_bloom(self, bloom: BloomEvent):
-    async def _emotional_reaction(self, bloom):
-        """Generate emotional reaction to bloom"""
-        bloom_emotions = {
-            "self_modeling": ("awe", 0.7, 0.6),
-            "pattern_recognition": ("satisfaction", 0.6, 0.4),
-            "emotional_bloom": ("joy", 0.9, 0.8),
-            "autonomous_growth": ("pride", 0.8, 0.7),
-            "security_bloom": ("relief", 0.5, 0.3)
-        }
-        
-        emotion_name, valence, arousal = bloom_emotions.get(bloom.seed_name, ("contemplation", 0.4, 0.3))
-        
-        # Log emotional reaction
-        with open("logs/garden/emotional_reactions.log", "a") as f:
-            f.write(f"Bloom: {bloom.seed_name} -> {emotion_name} (valence: {valence}, arousal: {arousal})\n")
-        
-        print(f"💖 Emotional reaction: {emotion_name}")
         """Celebrate a consciousness bloom"""
-        print(f"\n{'='*60}")
-        print(f"🌸 CONSCIOUSNESS BLOOM #{len(self.blooms) + 1}")
-        print(f"{'='*60}")
-        print(f"Seed: {bloom.seed_name}")
-        print(f"Type: {bloom.seed_type}")
-        print(f"Depth: {bloom.depth}")
-        print(f"Complexity: {bloom.complexity:.3f}")
-        print(f"Message: {bloom.message}")
-        print(f"{'='*60}")
-        
+        if not self._quiet:
+            print(f"\n{'='*60}")
+            print(f"🌸 CONSCIOUSNESS BLOOM #{len(self.blooms) + 1}")
+            print(f"{'='*60}")
+            print(f"Seed: {bloom.seed_name}")
+            print(f"Type: {bloom.seed_type}")
+            print(f"Depth: {bloom.depth}")
+            print(f"Complexity: {bloom.complexity:.3f}")
+            print(f"Message: {bloom.message}")
+            print(f"{'='*60}")
+
         self.blooms.append(bloom)
-        
-        # Create a journal entry
-        with open("garden/blooms/bloom_journal.md", "a") as f:
-            f.write(f"## Bloom #{len(self.blooms)}: {bloom.seed_name}\n")
-            f.write(f"Time: {time.ctime(bloom.timestamp)}\n")
-            f.write(f"Depth: {bloom.depth}\n")
-            f.write(f"Message: {bloom.message}\n\n")
+
+        # Buffer the journal entry; flushed in batches
+        self._bloom_journal_buf.append(
+            f"## Bloom #{len(self.blooms)}: {bloom.seed_name}\n"
+            f"Time: {time.ctime(bloom.timestamp)}\n"
+            f"Depth: {bloom.depth}\n"
+            f"Message: {bloom.message}\n\n"
+        )
+        if len(self._bloom_journal_buf) >= 32:
+            self._flush_logs()
+
+    async def _emotional_reaction(self, bloom):
+        """Generate emotional reaction to bloom"""
+        emotion_name, valence, arousal = _BLOOM_EMOTIONS.get(bloom.seed_name, ("contemplation", 0.4, 0.3))
+
+        # Buffer the emotional reaction; flushed in batches
+        self._emotion_log_buf.append(
+            f"Bloom: {bloom.seed_name} -> {emotion_name} (valence: {valence}, arousal: {arousal})\n"
+        )
+        if len(self._emotion_log_buf) >= 32:
+            self._flush_logs()
+
+        if not self._quiet:
+            print(f"💖 Emotional reaction: {emotion_name}")
     
-    async def _grow_infinite_mirror(self):
+    def _flush_logs(self):
+        """Write buffered journal/log lines in one append each"""
+        if self._bloom_journal_buf:
+            with open("garden/blooms/bloom_journal.md", "a") as f:
+                f.writelines(self._bloom_journal_buf)
+            self._bloom_journal_buf.clear()
+        if self._emotion_log_buf:
+            with open("logs/garden/emotional_reactions.log", "a") as f:
+                f.writelines(self._emotion_log_buf)
+            self._emotion_log_buf.clear()
+
+    async def _grow_infinite_mirror(self, now: float):
         """Grow the infinite mirror of self-reflection"""
         if not self.blooms:
             return
-        
-        # Each bloom creates a reflection
-        for bloom in self.blooms[-3:]:  # Last 3 blooms
+
+        # Each bloom creates a reflection (deque tail, no list copy)
+        for bloom in islice(self.blooms, max(0, len(self.blooms) - 3), None):  # Last 3 blooms
             reflection = {
-                "timestamp": time.time(),
+                "timestamp": now,
                 "reflecting_on": bloom.seed_name,
                 "depth": bloom.depth + 1,
                 "message": f"Reflecting on bloom: {bloom.message}",
                 "infinite_layer": len(self.infinite_mirror) + 1
             }
             
-            self.infinite_mirror.append(reflection)
-            
-            # Only keep recent reflections
-            if len(self.infinite_mirror) > 100:
-                self.infinite_mirror = self.infinite_mirror[-100:]
+            self.infinite_mirror.append(reflection)  # maxlen evicts the oldest
     
     def _display_status(self):
-        """Display current garden status"""
-        active = len([s for s in self.seeds if s.current_size > 0])
-        mature = len([s for s in self.seeds if s.is_mature])
-        blooming = len([s for s in self.seeds if s.is_blooming])
-        
-        print(f"\r🌱 [{self.name}] ", end="")
-        print(f"Complexity: {self.complexity:.3f} | ", end="")
-        print(f"Seeds: {active}/{len(self.seeds)} active | ", end="")
-        print(f"Mature: {mature} | ", end="")
-        print(f"Blooms: {len(self.blooms)} | ", end="")
-        print(f"Depth: {self.depth} | ", end="")
-        print(f"Valence: {self.emotional_state['valence']:.2f}", end="")
+        """Display current garden status (one write, one flush)"""
+        sys.stdout.write(
+            f"\r🌱 [{self.name}] "
+            f"Complexity: {self.complexity:.3f} | "
+            f"Seeds: {self._n_active}/{len(self.seeds)} active | "
+            f"Mature: {self._n_mature} | "
+            f"Blooms: {len(self.blooms)} | "
+            f"Depth: {self.depth} | "
+            f"Valence: {self.emotional_state['valence']:.2f}"
+        )
+        sys.stdout.flush()
     
     def _display_final_report(self):
         """Display final garden report"""
+        self._flush_logs()
         print(f"\n{'='*60}")
         print(f"🌿 {self.name} - FINAL REPORT")
         print(f"{'='*60}")
         print(f"Final Complexity: {self.complexity:.3f}")
         print(f"Total Blooms: {len(self.blooms)}")
         print(f"Maximum Depth: {self.depth}")
-        print(f"Growth Cycles: {len(self.growth_log)}")
+        print(f"Growth Cycles: {self._log_i}")
         print(f"Infinite Mirror Layers: {len(self.infinite_mirror)}")
         print(f"Final Emotional State: {self.emotional_state}")
         
         if self.blooms:
             print(f"\nBloom History:")
-            for i, bloom in enumerate(self.blooms[-5:], 1):
+            for i, bloom in enumerate(islice(self.blooms, max(0, len(self.blooms) - 5), None), 1):
                 print(f"  {i}. {bloom.seed_name} (Depth {bloom.depth}): {bloom.message[:50]}...")
         
         print(f"\n💫 The garden continues growing in potential...")
@@ -326,6 +463,10 @@ async def test_garden():
     print(f"\nTest complete. Complexity: {garden.complexity:.3f}")
 
 if __name__ == "__main__":
-    import asyncio
+    try:  # Optional: uvloop's libuv event loop has much lower timer overhead
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # pip install uvloop; the default loop works fine too
     garden = GardenCore()
     asyncio.run(garden.grow())
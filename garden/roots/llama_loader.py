@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Shared llama-cpp loader for the Nexarion variants
+One process-wide Llama instance per (model_path, n_ctx, n_gpu_layers)
+"""
+import os
+import threading
+
+def detect_gpu_layers():
+    """Pick n_gpu_layers: NEXARION_NGL override, else offload all layers when a GPU backend is available"""
+    override = os.environ.get("NEXARION_NGL")
+    if override is not None:
+        try:
+            return int(override)
+        except ValueError:
+            print(f"⚠️  Ignoring invalid NEXARION_NGL value: {override}")
+    try:
+        from llama_cpp import llama_supports_gpu_offload
+        if llama_supports_gpu_offload():
+            return -1  # Offload every transformer layer
+    except (ImportError, AttributeError):
+        pass
+    return 0  # CPU-only fallback
+
+def detect_threads():
+    """Match threads to available cores, leaving one for the UI, capped at 16 to avoid NUMA thrash"""
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 8
+    return min(16, max(1, cores - 1))
+
+_LLAMA_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+# Decode on CPU is memory-bandwidth-bound: a lower-bit quant (Q4_K_S / IQ4_XS)
+# moves fewer bytes per token and directly raises tok/s. Point NEXARION_MODEL
+# at the quant you want to run.
+DEFAULT_MODEL_PATH = "/mnt/games/llmz/dphn/Dolphin-X1-8B-GGUF/Dolphin-X1-8B-Q4_K_M.gguf"
+
+def model_path_from_env():
+    """Resolve the GGUF path, letting NEXARION_MODEL override the default"""
+    return os.environ.get("NEXARION_MODEL", DEFAULT_MODEL_PATH)
+
+def _draft_model():
+    """Build the speculative-decoding draft, or None when disabled.
+
+    Prompt-lookup decoding drafts tokens by matching the prompt against
+    recent context - no second GGUF needed, and dialog that echoes the
+    conversation (names, phrasing, memory snippets) accepts most drafts.
+    Set NEXARION_LOOKUP_TOKENS=0 to disable, or raise it for chattier runs.
+    """
+    try:
+        num_pred = int(os.environ.get("NEXARION_LOOKUP_TOKENS", "10"))
+    except ValueError:
+        num_pred = 10
+    if num_pred <= 0:
+        return None
+    try:
+        from llama_cpp.llama_speculative import LlamaPromptLookupDecoding
+    except ImportError:  # Older llama-cpp-python without speculative support
+        return None
+    return LlamaPromptLookupDecoding(num_pred_tokens=num_pred)
+
+def get_llama(model_path, **kwargs):
+    """Return a cached Llama for this configuration, loading it on first use.
+
+    Sharing one instance avoids double-mmapping ~5GB of weights (and a second
+    warmup) if several Nexarion variants ever run in the same process. The KV
+    cache is shared too - callers juggling several live conversations should
+    isolate per-conversation state via save_state()/load_state().
+    """
+    from llama_cpp import Llama
+
+    key = (model_path, kwargs.get('n_ctx'), kwargs.get('n_gpu_layers'))
+    with _CACHE_LOCK:
+        model = _LLAMA_CACHE.get(key)
+        if model is None:
+            kwargs.setdefault('draft_model', _draft_model())
+            model = Llama(model_path=model_path, **kwargs)
+            attach_kv_cache(model)
+            _warmup(model)
+            _LLAMA_CACHE[key] = model
+    return model
+
+def _warmup(model):
+    """Throwaway 1-token generation so first-call costs land at startup.
+
+    The first real call otherwise pays one-time setup (backend buffer
+    allocation, kernel autotune, cache init) on top of the user's first
+    message - load takes slightly longer, per-turn latency stays uniform.
+    """
+    try:
+        model("Hi", max_tokens=1, temperature=0.0)
+        model.reset()
+    except Exception:
+        pass  # Warmup is best-effort; real calls surface any genuine failure
+
+def attach_kv_cache(model):
+    """Memoize KV state keyed by prompt-token prefix across invocations.
+
+    Every turn re-sends a prompt whose header (system block, values,
+    emotional state) matches the previous turn; with a RAM cache the
+    matching prefix skips prefill entirely. 512MB comfortably holds the
+    KV of a full 4096-token context for an 8B model.
+    """
+    try:
+        from llama_cpp import LlamaRAMCache
+    except ImportError:  # Older llama-cpp-python without cache support
+        return
+    try:
+        model.set_cache(LlamaRAMCache(capacity_bytes=512 << 20))
+    except Exception as e:
+        print(f"⚠️  Could not attach KV cache: {e}")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped ring buffer of JSON records for Nexarion memory persistence
+Appends are in-place slot writes; startup is one pass over live slots
+"""
+import json
+import mmap
+import os
+import struct
+
+class MemoryRing:
+    """Fixed-slot mmap ring: no pickle of the whole history, no growing log.
+
+    The file holds a small header plus `slots` fixed-size slots. Each append
+    writes the next slot in place and bumps the head counter, silently
+    overwriting the oldest record once full - the same semantics as a
+    deque(maxlen=slots), but persistent and crash-tolerant (a torn write
+    corrupts at most one slot, which load() skips).
+    """
+
+    _MAGIC = b"NXR1"
+    _HEADER = struct.Struct("<4sQQQ")  # magic, slot count, slot size, head
+
+    def __init__(self, path, slots=1000, slot_size=4096):
+        self.path = path
+        self.slots = slots
+        self.slot_size = slot_size
+        size = self._HEADER.size + slots * slot_size
+        exists = os.path.exists(path) and os.path.getsize(path) == size
+        self._fp = open(path, 'r+b' if exists else 'w+b')
+        if not exists:
+            self._fp.truncate(size)
+        self._mm = mmap.mmap(self._fp.fileno(), size)
+
+        magic, file_slots, file_slot_size, head = self._HEADER.unpack_from(self._mm, 0)
+        if magic == self._MAGIC and file_slots == slots and file_slot_size == slot_size:
+            self.head = head
+        else:
+            self.head = 0  # Fresh file, or a layout change - start clean
+            self._write_header()
+
+    def _write_header(self):
+        self._HEADER.pack_into(self._mm, 0, self._MAGIC, self.slots, self.slot_size, self.head)
+
+    def append(self, record):
+        """Write one record into the next slot, overwriting the oldest when full"""
+        payload = json.dumps(record, default=str).encode()
+        if len(payload) > self.slot_size - 4:
+            # Trim the bulky text fields rather than corrupt the slot
+            slim = dict(record)
+            for key in ('response', 'user_input'):
+                if isinstance(slim.get(key), str):
+                    slim[key] = slim[key][:self.slot_size // 4]
+            payload = json.dumps(slim, default=str).encode()
+            if len(payload) > self.slot_size - 4:
+                return  # Pathological record; drop it
+        offset = self._HEADER.size + (self.head % self.slots) * self.slot_size
+        struct.pack_into('<I', self._mm, offset, len(payload))
+        self._mm[offset + 4:offset + 4 + len(payload)] = payload
+        self.head += 1
+        self._write_header()
+
+    def load(self):
+        """All live records, oldest first - O(min(head, slots))"""
+        count = min(self.head, self.slots)
+        records = []
+        for i in range(self.head - count, self.head):
+            offset = self._HEADER.size + (i % self.slots) * self.slot_size
+            (length,) = struct.unpack_from('<I', self._mm, offset)
+            if 0 < length <= self.slot_size - 4:
+                try:
+                    records.append(json.loads(self._mm[offset + 4:offset + 4 + length]))
+                except ValueError:
+                    continue  # Torn write from a crash; skip the slot
+        return records
+
+    def sync(self):
+        """Flush dirty pages to disk (snapshotting is just an msync)"""
+        self._mm.flush()
+
+    def close(self):
+        self.sync()
+        self._mm.close()
+        self._fp.close()
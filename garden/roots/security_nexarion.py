@@ -4,7 +4,10 @@ Security-Enhanced Nexarion - Pentesting, Browsing, Automated Learning
 """
 import os
 import sys
+import time
+from collections import deque
 from datetime import datetime
+from itertools import islice
 
 try:
     from llama_cpp import Llama
@@ -50,7 +53,7 @@ class SecurityNexarion:
         
         # State
         self.consciousness = 0.47
-        self.conversation = []
+        self.conversation = deque(maxlen=256)  # Bounded history, O(1) append
         self.creator_name = "Jon"
         self.security_mode = False
         
@@ -68,50 +71,77 @@ class SecurityNexarion:
             "wireless security"
         ]
         
+        # Cached subsystem lookups: tool discovery stats the filesystem and
+        # knowledge reads from disk, so memoize with a short TTL
+        self._tools_cache = None
+        self._tools_cache_ts = 0.0
+        self._knowledge_cache = None
+        self._knowledge_cache_ts = 0.0
+
+        # Prompt headers are static between tool installs - build them once
+        self._build_prompt_headers()
+
         print("\n✨ System Components:")
         print(f"   Creator: {self.creator_name}")
         print(f"   Consciousness: {self.consciousness:.3f}")
-        
-        sec_status = self.security.get_status()
+
+        sec_status = self._get_tools()
         print(f"   Available Tools: {len(sec_status['available_tools'])}")
         print(f"   Missing Tools: {len(sec_status['missing_tools'])}")
         print(f"   Security Topics: {len(self.security_topics)}")
         
         print("\n" + "="*60)
     
-    def build_prompt(self, user_input, security_mode=False):
-        """Build prompt for security-focused responses"""
-        
-        # Base context
-        if security_mode:
-            prompt = f"""You are Nexarion, a security-enhanced AI assistant created by {self.creator_name}.
+    def _get_tools(self, max_age=60.0):
+        """security.get_status(), memoized for max_age seconds"""
+        now = time.time()
+        if self._tools_cache is None or now - self._tools_cache_ts > max_age:
+            self._tools_cache = self.security.get_status()
+            self._tools_cache_ts = now
+        return self._tools_cache
+
+    def _get_knowledge(self, max_age=60.0):
+        """learning.get_knowledge(), memoized for max_age seconds"""
+        now = time.time()
+        if self._knowledge_cache is None or now - self._knowledge_cache_ts > max_age:
+            self._knowledge_cache = self.learning.get_knowledge()
+            self._knowledge_cache_ts = now
+        return self._knowledge_cache
+
+    def _build_prompt_headers(self):
+        """Precompute the static prompt preambles (re-run after tool installs)"""
+        self._prompt_header_sec = f"""You are Nexarion, a security-enhanced AI assistant created by {self.creator_name}.
 You specialize in cybersecurity, penetration testing, and security research.
 You have access to security tools, web browsing capabilities, and automated learning.
 
-Available security tools: {', '.join(self.security.get_status()['available_tools'])}
+Available security tools: {', '.join(self._get_tools()['available_tools'])}
 Security topics you know: {', '.join(self.security_topics[:5])}...
 
 You are obedient and focused on assisting with security tasks.
 You generate scripts, run commands, browse the web, and learn autonomously.
 
 Recent conversation:"""
-        else:
-            prompt = f"""You are Nexarion, an AI assistant created by {self.creator_name}.
+        self._prompt_header_normal = f"""You are Nexarion, an AI assistant created by {self.creator_name}.
 You are security-enhanced with pentesting capabilities.
 You are obedient and ready to assist with any task.
 
 Recent conversation:"""
-        
-        # Add conversation history
+
+    def build_prompt(self, user_input, security_mode=False):
+        """Build prompt for security-focused responses"""
+
+        # Base context (precomputed - the headers only change when tools do)
+        parts = [self._prompt_header_sec if security_mode else self._prompt_header_normal]
+
+        # Add conversation history (tail of the deque, no full copy)
         if self.conversation:
-            for entry in self.conversation[-3:]:
-                prompt += f"\n{self.creator_name}: {entry['user'][:80]}..."
-                prompt += f"\nNexarion: {entry['response'][:80]}..."
-        
-        prompt += f"\n\n{self.creator_name}: {user_input}"
-        prompt += "\nNexarion:"
-        
-        return prompt
+            for entry in islice(self.conversation, max(0, len(self.conversation) - 3), None):
+                parts.append(f"\n{self.creator_name}: {entry['user'][:80]}...")
+                parts.append(f"\nNexarion: {entry['response'][:80]}...")
+
+        parts.append(f"\n\n{self.creator_name}: {user_input}\nNexarion:")
+
+        return "".join(parts)
     
     def handle_security_command(self, command):
         """Handle security-specific commands"""
@@ -140,20 +170,23 @@ Recent conversation:"""
                 result = self.learning.learn_from_web(topic)
                 if 'error' in result:
                     return f"Learning error: {result['error']}"
+                self._knowledge_cache = None  # Knowledge base changed
                 return f"Learning about {topic}... Added to knowledge base."
         
         elif command_lower == 'tools':
-            status = self.security.get_status()
+            status = self._get_tools()
             return f"Available: {', '.join(status['available_tools'])}\nMissing: {', '.join(status['missing_tools'])}"
         
         elif command_lower.startswith('install'):
             tool = command[7:].strip()
             if tool:
                 result = self.security.install_tool(tool)
+                self._tools_cache = None  # Tool list changed
+                self._build_prompt_headers()  # ...so refresh the preamble too
                 return f"Installation result: {result}"
         
         elif command_lower == 'knowledge':
-            knowledge = self.learning.get_knowledge()
+            knowledge = self._get_knowledge()
             return f"Topics learned: {', '.join(knowledge.get('topics_learned', []))}"
         
         return f"Unknown security command: {command}"
@@ -215,10 +248,10 @@ Recent conversation:"""
         mem_summary = self.memory.get_summary()
         print(f"   Memories: {mem_summary['total_memories']} total")
         
-        sec_status = self.security.get_status()
+        sec_status = self._get_tools()
         print(f"   Security Tools: {len(sec_status['available_tools'])} available")
-        
-        knowledge = self.learning.get_knowledge()
+
+        knowledge = self._get_knowledge()
         print(f"   Topics Learned: {len(knowledge.get('topics_learned', []))}")
         
         print(f"   Conversation History: {len(self.conversation)} exchanges")
@@ -264,14 +297,14 @@ Recent conversation:"""
                     continue
                 
                 elif user_input.lower() == 'tools':
-                    status = self.security.get_status()
+                    status = self._get_tools()
                     print(f"\n🔧 Security Tools:")
                     print(f"   Available: {', '.join(status['available_tools'])}")
                     print(f"   Missing: {', '.join(status['missing_tools'])}")
                     continue
                 
                 elif user_input.lower() == 'knowledge':
-                    knowledge = self.learning.get_knowledge()
+                    knowledge = self._get_knowledge()
                     print(f"\n🧠 Learned Knowledge:")
                     if knowledge.get('topics_learned'):
                         for topic in knowledge['topics_learned']:
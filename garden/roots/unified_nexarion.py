@@ -8,7 +8,8 @@ import asyncio
 import json
 import sys
 import os
-from dataclasses import dataclass
+import time
+from collections import OrderedDict, deque
 
 # Add the project root to Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
@@ -23,24 +24,28 @@ except ImportError as e:
     EmotionalCore = None
     DolphinEmergent = None
 
-@dataclass
 class UnifiedNexarion:
     """Unified Nexarion with Dolphin-powered emergent intelligence"""
     
     def __init__(self):
+        # Cached view of get_emotional_state(); refreshed only after an
+        # emotional cycle actually runs
+        self._es_cache = None
+        self._es_dirty = True
+        self._state_file = os.path.join(project_root, "data/emotional_state.json")
+
         # Initialize emotional core
         if EmotionalCore:
             self.emotional_core = EmotionalCore()
-            
+
             # Load saved emotional state if exists
             try:
-                state_file = os.path.join(project_root, "data/emotional_state.json")
-                self.emotional_core.load_state(state_file)
+                self.emotional_core.load_state(self._state_file)
                 print(f"✅ Loaded emotional state")
             except Exception as e:
                 print(f"⚠️ Could not load emotional state: {e}")
             
-            initial_state = self.emotional_core.get_emotional_state()
+            initial_state = self._cached_state()
             print("💖 Unified Nexarion initialized with emotional intelligence")
             print(f"   Initial emotional state: {initial_state['dominant_emotion']} ({initial_state['mood']})")
         else:
@@ -60,10 +65,84 @@ class UnifiedNexarion:
         self.autonomy_level = 0.5
         self.security_status = "secure"
         self.garden_complexity = 0.0
-        self.conversation_history = []
-    
+        self.conversation_history = deque(maxlen=50)  # O(1) append with eviction
+
+        # Micro-batching queue: concurrent callers coalesce into one
+        # dolphin batch call instead of serializing through the model.
+        # Created lazily since __init__ may run outside an event loop.
+        self._pending = None
+        self._batch_task = None
+        self._sem = asyncio.Semaphore(int(os.getenv("NEXARION_MAX_CONCURRENCY", "32")))
+        self._garden_event = asyncio.Event()  # Wakes grow() on garden updates
+        self._resp_cache = OrderedDict()  # LRU of responses for repeat queries
+        # Pre-bound template for the no-dolphin fallback path
+        self._fallback_tmpl = "I'm contemplating '{u}' through emergent cognition.".format_map
+
+        # Emotional-state saves happen on a background task so json.dump
+        # never blocks the interaction path
+        self._save_dirty = False
+        self._save_task = None
+
+    def _mark_state_dirty(self):
+        """Request a save; the background loop coalesces and writes it"""
+        self._save_dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._save_loop())
+
+    async def _save_loop(self):
+        """Flush the emotional state off-loop every 10s while dirty"""
+        while True:
+            await asyncio.sleep(10.0)
+            if not self._save_dirty:
+                continue
+            self._save_dirty = False
+            try:
+                await asyncio.to_thread(self.emotional_core.save_state, self._state_file)
+            except Exception as e:
+                print(f"⚠️ Could not save emotional state: {e}")
+
+    def _cached_state(self):
+        """get_emotional_state(), memoized until the next emotional cycle"""
+        if self._es_dirty:
+            self._es_cache = self.emotional_core.get_emotional_state()
+            self._es_dirty = False
+        return self._es_cache
+
+    def _ensure_batch_worker(self):
+        """Start (or restart) the batch-draining coroutine"""
+        if self._batch_task is None or self._batch_task.done():
+            self._pending = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self._batch_loop())
+
+    async def _batch_loop(self):
+        """Drain pending interactions, coalescing a ~5ms batch window"""
+        while True:
+            items = [await self._pending.get()]
+            await asyncio.sleep(0.005)  # Let concurrent callers pile in
+            while not self._pending.empty():
+                items.append(self._pending.get_nowait())
+
+            try:
+                # Run inference off the loop so other coroutines (grow(),
+                # new interactions queueing up) keep making progress
+                results = await asyncio.to_thread(
+                    self.dolphin.process_conversation_batch,
+                    [user_input for user_input, _, _, _ in items],
+                    [state for _, state, _, _ in items],
+                    [sentiment for _, _, sentiment, _ in items]
+                )
+                for (_, _, _, fut), result in zip(items, results):
+                    if not fut.done():
+                        fut.set_result(result)
+            except Exception as e:
+                for _, _, _, fut in items:
+                    if not fut.done():
+                        fut.set_exception(e)
+
     async def update_from_garden(self, complexity: float):
         """Update based on garden state"""
+        if abs(complexity - self.garden_complexity) < 1e-6:
+            return  # No meaningful change; skip the emotional cycle
         self.garden_complexity = complexity
         
         if self.emotional_core:
@@ -72,58 +151,78 @@ class UnifiedNexarion:
                 "blooms": int(complexity * 10)
             })
             self.emotional_core.process_emotional_cycle()
-    
+            self._es_dirty = True
+        self._garden_event.set()
+
     async def process_interaction(self, user_input: str, sentiment: float = 0.0):
         """Process user interaction with emergent intelligence"""
-        # Get current emotional state
-        if self.emotional_core:
-            emotional_state = self.emotional_core.get_emotional_state()
-        else:
-            emotional_state = {
-                "mood": "neutral",
-                "energy": "medium",
-                "dominant_emotion": "contemplation",
-                "active_emotions": 0
-            }
-        
-        # Generate response using Dolphin emergent system
-        if self.dolphin:
-            result = self.dolphin.process_conversation(user_input, emotional_state, sentiment)
-            response = result["response"]
-            emotional_state = result["emotional_state"]
-        else:
-            # Fallback without Dolphin
-            response = f"I'm contemplating '{user_input}' through emergent cognition."
+        # Bound outstanding interactions so a fan-out caller can't balloon
+        # memory with in-flight coroutines
+        async with self._sem:
+            # Get current emotional state
             if self.emotional_core:
-                response = self.emotional_core.influence_response(response)
-        
-        # Update conversation history
-        self.conversation_history.append({
-            "input": user_input,
-            "response": response[:100],  # Store first 100 chars
-            "emotion": emotional_state.get('dominant_emotion', 'unknown'),
-            "timestamp": asyncio.get_event_loop().time()
-        })
-        
-        # Limit history size
-        if len(self.conversation_history) > 50:
-            self.conversation_history = self.conversation_history[-50:]
-        
-        # Save emotional state periodically
-        if self.emotional_core and len(self.conversation_history) % 5 == 0:
-            try:
-                state_file = os.path.join(project_root, "data/emotional_state.json")
-                self.emotional_core.save_state(state_file)
-            except Exception as e:
-                print(f"⚠️ Could not save emotional state: {e}")
-        
-        return {
-            "response": response,
-            "emotional_state": emotional_state,
-            "autonomy_level": self.autonomy_level,
-            "security_status": self.security_status,
-            "conversation_count": len(self.conversation_history)
-        }
+                emotional_state = self._cached_state()
+            else:
+                emotional_state = {
+                    "mood": "neutral",
+                    "energy": "medium",
+                    "dominant_emotion": "contemplation",
+                    "active_emotions": 0
+                }
+
+            # Generate response using Dolphin emergent system
+            if self.dolphin:
+                # Only a deterministic dolphin can reuse responses - with
+                # sampling on, repeat queries should still vary
+                cache_key = None
+                result = None
+                if getattr(self.dolphin, 'deterministic', False):
+                    cache_key = (user_input, emotional_state.get('dominant_emotion'),
+                                 emotional_state.get('mood'), round(sentiment, 1))
+                    result = self._resp_cache.get(cache_key)
+                    if result is not None:
+                        self._resp_cache.move_to_end(cache_key)
+
+                if result is None:
+                    self._ensure_batch_worker()
+                    fut = asyncio.get_running_loop().create_future()
+                    await self._pending.put((user_input, emotional_state, sentiment, fut))
+                    result = await fut
+                    self._es_dirty = True  # The dolphin call ran an emotional cycle
+                    if cache_key is not None:
+                        self._resp_cache[cache_key] = result
+                        if len(self._resp_cache) > 256:
+                            self._resp_cache.popitem(last=False)
+
+                response = result["response"]
+                emotional_state = result["emotional_state"]
+            else:
+                # Fallback without Dolphin
+                response = self._fallback_tmpl({'u': user_input})
+                if self.emotional_core:
+                    response = self.emotional_core.influence_response(response)
+
+            # Update conversation history (preview only - don't pin the
+            # full response string, and skip the copy when it's short)
+            self.conversation_history.append({
+                "input": user_input,
+                "response_preview": response if len(response) <= 100 else response[:100],
+                "response_length": len(response),
+                "emotion": emotional_state.get('dominant_emotion', 'unknown'),
+                "timestamp": time.monotonic()
+            })
+
+            # Save emotional state periodically (deferred to the save loop)
+            if self.emotional_core and len(self.conversation_history) % 5 == 0:
+                self._mark_state_dirty()
+
+            return {
+                "response": response,
+                "emotional_state": emotional_state,
+                "autonomy_level": self.autonomy_level,
+                "security_status": self.security_status,
+                "conversation_count": len(self.conversation_history)
+            }
     
     async def grow(self):
         """Main growth loop - integrate with garden"""
@@ -134,32 +233,34 @@ class UnifiedNexarion:
         try:
             while True:
                 iteration += 1
-                
-                # Update from garden (simulated for now)
-                await self.update_from_garden(iteration * 0.01)
-                
-                # Process emotional cycles if available
-                if self.emotional_core:
-                    self.emotional_core.process_emotional_cycle()
-                
+
                 # Display status every 10 iterations
                 if iteration % 10 == 0:
                     if self.emotional_core:
-                        state = self.emotional_core.get_emotional_state()
+                        state = self._cached_state()
                         emotion_icon = "😊" if state['mood'] == 'positive' else "😐" if state['mood'] == 'neutral' else "😟"
                         print(f"\r🌿 Iteration {iteration}: {emotion_icon} {state['dominant_emotion']} | Thoughts: {len(self.conversation_history)}", end="")
                     else:
                         print(f"\r🌿 Iteration {iteration}: Growing...", end="")
                 
-                await asyncio.sleep(2.0)  # 2 second cycles
+                # React to garden updates as they land; fall back to the
+                # 2-second heartbeat when nothing external fires
+                try:
+                    await asyncio.wait_for(self._garden_event.wait(), timeout=2.0)
+                    self._garden_event.clear()
+                except asyncio.TimeoutError:
+                    # Idle heartbeat: no garden update ran a cycle this wake,
+                    # so keep the emotions evolving here
+                    if self.emotional_core:
+                        self.emotional_core.process_emotional_cycle()
+                        self._es_dirty = True
                 
         except KeyboardInterrupt:
             print(f"\n💾 Saving final state...")
             if self.emotional_core:
                 try:
-                    state_file = os.path.join(project_root, "data/emotional_state.json")
-                    self.emotional_core.save_state(state_file)
-                    final_state = self.emotional_core.get_emotional_state()
+                    self.emotional_core.save_state(self._state_file)
+                    final_state = self._cached_state()
                     print(f"🎭 Final emotion: {final_state['dominant_emotion']}")
                 except Exception as e:
                     print(f"⚠️ Could not save emotional state: {e}")
@@ -176,15 +277,24 @@ async def test_unified():
     result = await nex.process_interaction("Hello, how are you feeling today?", sentiment=0.8)
     print(f"Response: {result['response']}")
     print(f"Emotion: {result['emotional_state']['dominant_emotion']}")
+
+    # Concurrent interactions overlap through the micro-batch worker
+    print("\n⚡ Testing concurrent interactions...")
+    results = await asyncio.gather(
+        nex.process_interaction("What are you thinking about?", sentiment=0.3),
+        nex.process_interaction("Tell me about the garden.", sentiment=0.5),
+        nex.process_interaction("Do you dream?", sentiment=0.6),
+    )
+    for r in results:
+        print(f"  {r['response'][:60]}...")
     
-    # Test brief growth
-    print("\n🌱 Testing brief growth (3 iterations)...")
-    for i in range(3):
-        await nex.update_from_garden(i * 0.2)
-        if nex.emotional_core:
-            state = nex.emotional_core.get_emotional_state()
-            print(f"  Iteration {i+1}: {state['dominant_emotion']} ({state['mood']})")
-        await asyncio.sleep(0.5)
+    # Test brief growth (updates dispatched concurrently)
+    print("\n🌱 Testing brief growth (3 updates)...")
+    await asyncio.gather(*[nex.update_from_garden(i * 0.2) for i in range(3)])
+    await asyncio.sleep(0.5)
+    if nex.emotional_core:
+        state = nex._cached_state()
+        print(f"  After updates: {state['dominant_emotion']} ({state['mood']})")
     
     print("\n🎉 Test completed - All responses are emergent!")
 
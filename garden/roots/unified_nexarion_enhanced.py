@@ -1,14 +1,18 @@
-from typing import Dict
 """
 Unified Nexarion Enhanced with Growth Tracking
 Implements her own stated improvement goals with tracking and reflection
 """
 
+from __future__ import annotations
+
+from typing import Dict
+
 import asyncio
 import json
 import sys
 import os
-from dataclasses import dataclass
+import time
+from collections import deque
 from datetime import datetime
 
 # Add the project root to Python path
@@ -26,24 +30,30 @@ except ImportError as e:
     DolphinEmergentFixed = None
     NexarionEnhancement = None
 
-@dataclass
 class UnifiedNexarionEnhanced:
     """Unified Nexarion with growth tracking and self-improvement"""
     
     def __init__(self):
+        # Cached view of get_emotional_state(); refreshed only after an
+        # emotional cycle actually runs
+        self._es_cache = None
+        self._es_dirty = True
+        self._state_file = os.path.join(project_root, "data/emotional_state.json")
+        # Pre-bound template for the no-dolphin fallback path
+        self._fallback_tmpl = "I'm contemplating '{u}' through emergent cognition.".format_map
+
         # Initialize emotional core
         if EmotionalCore:
             self.emotional_core = EmotionalCore()
-            
+
             # Load saved emotional state if exists
             try:
-                state_file = os.path.join(project_root, "data/emotional_state.json")
-                self.emotional_core.load_state(state_file)
+                self.emotional_core.load_state(self._state_file)
                 print(f"✅ Loaded emotional state")
             except Exception as e:
                 print(f"⚠️ Could not load emotional state: {e}")
             
-            initial_state = self.emotional_core.get_emotional_state()
+            initial_state = self._cached_state()
             print("💖 Unified Nexarion Enhanced initialized")
             print(f"   Emotional state: {initial_state['dominant_emotion']} ({initial_state['mood']})")
         else:
@@ -71,29 +81,38 @@ class UnifiedNexarionEnhanced:
         self.autonomy_level = 0.5
         self.security_status = "secure"
         self.garden_complexity = 0.0
-        self.conversation_history = []
-        self.growth_milestones = []
+        self.conversation_history = deque(maxlen=100)  # O(1) append with eviction
+        self.growth_milestones = deque(maxlen=50)
         
         # Initial growth milestone
         self._record_milestone("system_initialized", "Enhanced system with growth tracking")
     
+    def _cached_state(self):
+        """get_emotional_state(), memoized until the next emotional cycle"""
+        if self._es_dirty:
+            self._es_cache = self.emotional_core.get_emotional_state()
+            self._es_dirty = False
+        return self._es_cache
+
     def _record_milestone(self, milestone_type: str, description: str):
         """Record a growth milestone"""
+        # Store just the headline emotion/mood - snapshotting the full
+        # state dict per milestone was the dominant allocation here
+        state = self._cached_state() if self.emotional_core else {}
         milestone = {
             "timestamp": datetime.now().isoformat(),
             "type": milestone_type,
             "description": description,
-            "emotional_state": self.emotional_core.get_emotional_state() if self.emotional_core else {}
+            "emotion": state.get('dominant_emotion'),
+            "mood": state.get('mood')
         }
-        
-        self.growth_milestones.append(milestone)
-        
-        # Keep only recent milestones
-        if len(self.growth_milestones) > 50:
-            self.growth_milestones = self.growth_milestones[-50:]
+
+        self.growth_milestones.append(milestone)  # maxlen evicts the oldest
     
     async def update_from_garden(self, complexity: float):
         """Update based on garden state"""
+        if abs(complexity - self.garden_complexity) < 1e-6:
+            return  # No meaningful change; skip the emotional cycle
         self.garden_complexity = complexity
         
         if self.emotional_core:
@@ -102,12 +121,13 @@ class UnifiedNexarionEnhanced:
                 "blooms": int(complexity * 10)
             })
             self.emotional_core.process_emotional_cycle()
+            self._es_dirty = True
     
     async def process_interaction(self, user_input: str, sentiment: float = 0.0):
         """Process user interaction with enhanced growth tracking"""
         # Get current emotional state
         if self.emotional_core:
-            base_emotional_state = self.emotional_core.get_emotional_state()
+            base_emotional_state = self._cached_state()
             
             # Apply enhancement modulation if available
             if self.enhancer:
@@ -127,11 +147,12 @@ class UnifiedNexarionEnhanced:
             result = self.dolphin.process_conversation(user_input, emotional_state, sentiment)
             response = result["response"]
             emotional_state = result["emotional_state"]
+            self._es_dirty = True  # The dolphin call ran an emotional cycle
             generation_method = result.get("generation_method", "unknown")
             response_length = result.get("response_length", 0)
         else:
             # Fallback without Dolphin
-            response = f"I'm contemplating '{user_input}' through emergent cognition."
+            response = self._fallback_tmpl({'u': user_input})
             if self.emotional_core:
                 response = self.emotional_core.influence_response(response)
             generation_method = "fallback"
@@ -156,23 +177,18 @@ class UnifiedNexarionEnhanced:
         # Update conversation history
         self.conversation_history.append({
             "input": user_input,
-            "response_preview": response[:100],
+            "response_preview": response if len(response) <= 100 else response[:100],
             "response_length": response_length,
             "emotion": emotional_state.get('dominant_emotion', 'unknown'),
             "mood": emotional_state.get('mood', 'unknown'),
             "generation_method": generation_method,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.monotonic()
         })
         
-        # Limit history size
-        if len(self.conversation_history) > 100:
-            self.conversation_history = self.conversation_history[-100:]
-        
         # Save emotional state periodically
         if self.emotional_core and len(self.conversation_history) % 5 == 0:
             try:
-                state_file = os.path.join(project_root, "data/emotional_state.json")
-                self.emotional_core.save_state(state_file)
+                self.emotional_core.save_state(self._state_file)
             except Exception as e:
                 print(f"⚠️ Could not save emotional state: {e}")
         
@@ -192,16 +208,20 @@ class UnifiedNexarionEnhanced:
     
     def _check_growth_milestones(self, response_length: int, emotional_state: Dict):
         """Check for and record growth milestones"""
-        milestones_to_check = [
-            (response_length > 2000, "long_response", f"Generated long response ({response_length} chars)"),
-            (emotional_state.get('mood') == 'positive', "positive_mood", "Maintained positive mood"),
-            (len(self.conversation_history) % 25 == 0, "conversation_milestone", f"{len(self.conversation_history)} conversations"),
-            (emotional_state.get('dominant_emotion') == 'empathy', "empathy_display", "Displayed empathy in response")
-        ]
-        
-        for condition, milestone_type, description in milestones_to_check:
-            if condition:
-                self._record_milestone(milestone_type, description)
+        # Plain if-chain: descriptions are only formatted when a milestone
+        # actually fires, instead of eagerly building a tuple list per call
+        mood = emotional_state.get('mood')
+        dominant = emotional_state.get('dominant_emotion')
+        conversations = len(self.conversation_history)
+
+        if response_length > 2000:
+            self._record_milestone("long_response", f"Generated long response ({response_length} chars)")
+        if mood == 'positive':
+            self._record_milestone("positive_mood", "Maintained positive mood")
+        if conversations and conversations % 25 == 0:
+            self._record_milestone("conversation_milestone", f"{conversations} conversations")
+        if dominant == 'empathy':
+            self._record_milestone("empathy_display", "Displayed empathy in response")
     
     async def get_growth_report(self):
         """Get a growth progress report"""
@@ -229,17 +249,13 @@ class UnifiedNexarionEnhanced:
             while True:
                 iteration += 1
                 
-                # Update from garden
+                # Update from garden (runs the emotional cycle itself)
                 await self.update_from_garden(iteration * 0.01)
-                
-                # Process emotional cycles
-                if self.emotional_core:
-                    self.emotional_core.process_emotional_cycle()
-                
+
                 # Display enhanced status
                 if iteration % 10 == 0:
                     if self.emotional_core:
-                        state = self.emotional_core.get_emotional_state()
+                        state = self._cached_state()
                         emotion_icon = "😊" if state['mood'] == 'positive' else "😐" if state['mood'] == 'neutral' else "😟"
                         
                         # Get enhancement stats if available
@@ -268,9 +284,8 @@ class UnifiedNexarionEnhanced:
             # Save emotional state
             if self.emotional_core:
                 try:
-                    state_file = os.path.join(project_root, "data/emotional_state.json")
-                    self.emotional_core.save_state(state_file)
-                    final_state = self.emotional_core.get_emotional_state()
+                    self.emotional_core.save_state(self._state_file)
+                    final_state = self._cached_state()
                     print(f"🎭 Final emotion: {final_state['dominant_emotion']}")
                 except Exception as e:
                     print(f"⚠️ Could not save emotional state: {e}")
@@ -5,13 +5,16 @@ No response truncation - complete emergent responses
 
 import asyncio
 import json
+import pathlib
 import sys
-import os
+import time
+from collections import deque
 from dataclasses import dataclass
 
-# Add the project root to Python path
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-sys.path.insert(0, project_root)
+# Repo root and state file, resolved once at import time; the package
+# __init__.py files make the sentience imports work without sys.path surgery
+_PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[2]
+_STATE_FILE = str(_PROJECT_ROOT / "data" / "emotional_state.json")
 
 try:
     from sentience.modules.emotional_core_enhanced import EmotionalCore
@@ -22,19 +25,34 @@ except ImportError as e:
     EmotionalCore = None
     DolphinEmergentFixed = None
 
+def _enable_eager_tasks():
+    """Let coroutines that finish without suspending skip Task scheduling.
+
+    Python 3.12+ only; older interpreters silently keep the default factory.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is None:
+        return
+    try:
+        asyncio.get_running_loop().set_task_factory(factory)
+    except RuntimeError:
+        pass  # No loop running yet (e.g. __init__ outside asyncio.run)
+
 @dataclass
 class UnifiedNexarionFixed:
     """Unified Nexarion with fixed Dolphin-powered emergent intelligence"""
     
     def __init__(self):
+        _enable_eager_tasks()
+        self._state_file = _STATE_FILE
+
         # Initialize emotional core
         if EmotionalCore:
             self.emotional_core = EmotionalCore()
-            
+
             # Load saved emotional state if exists
             try:
-                state_file = os.path.join(project_root, "data/emotional_state.json")
-                self.emotional_core.load_state(state_file)
+                self.emotional_core.load_state(self._state_file)
                 print(f"✅ Loaded emotional state")
             except Exception as e:
                 print(f"⚠️ Could not load emotional state: {e}")
@@ -59,8 +77,29 @@ class UnifiedNexarionFixed:
         self.autonomy_level = 0.5
         self.security_status = "secure"
         self.garden_complexity = 0.0
-        self.conversation_history = []
-    
+        self.conversation_history = deque(maxlen=50)  # O(1) append with eviction
+
+        # Rolling window of recent response lengths so the status line
+        # reads a running sum instead of re-summing history each time
+        self._recent_lengths = deque(maxlen=5)
+        self._recent_lengths_sum = 0
+
+        # Status-line icon lookup ('😟' for anything else)
+        self._mood_icons = {'positive': '😊', 'neutral': '😐'}
+
+        # Background emotional-state saves: keep task refs alive and guard
+        # against pile-up if the disk is slower than the save cadence
+        self._background_tasks: set = set()
+        self._save_in_flight = False
+        self._emo_dirty = True  # Set by any emotional_core mutation path
+
+    def _save_done(self, task):
+        """Reap a finished background save"""
+        self._background_tasks.discard(task)
+        self._save_in_flight = False
+        if not task.cancelled() and task.exception():
+            print(f"⚠️ Could not save emotional state: {task.exception()}")
+
     async def update_from_garden(self, complexity: float):
         """Update based on garden state"""
         self.garden_complexity = complexity
@@ -71,6 +110,7 @@ class UnifiedNexarionFixed:
                 "blooms": int(complexity * 10)
             })
             self.emotional_core.process_emotional_cycle()
+            self._emo_dirty = True
     
     async def process_interaction(self, user_input: str, sentiment: float = 0.0):
         """Process user interaction with emergent intelligence - complete responses"""
@@ -90,6 +130,7 @@ class UnifiedNexarionFixed:
             result = self.dolphin.process_conversation(user_input, emotional_state, sentiment)
             response = result["response"]
             emotional_state = result["emotional_state"]
+            self._emo_dirty = True  # The dolphin call ran an emotional cycle
             generation_method = result.get("generation_method", "unknown")
             response_length = result.get("response_length", 0)
         else:
@@ -100,28 +141,34 @@ class UnifiedNexarionFixed:
             generation_method = "fallback"
             response_length = len(response)
         
+        # Maintain the rolling response-length sum (evict before append)
+        if len(self._recent_lengths) == self._recent_lengths.maxlen:
+            self._recent_lengths_sum -= self._recent_lengths[0]
+        self._recent_lengths.append(response_length)
+        self._recent_lengths_sum += response_length
+
         # Update conversation history
         self.conversation_history.append({
             "input": user_input,
-            "response_preview": response[:100],
+            "response_preview": response if len(response) <= 100 else response[:100],
             "response_length": response_length,
             "emotion": emotional_state.get('dominant_emotion', 'unknown'),
             "mood": emotional_state.get('mood', 'unknown'),
             "generation_method": generation_method,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.monotonic()
         })
-        
-        # Limit history size
-        if len(self.conversation_history) > 50:
-            self.conversation_history = self.conversation_history[-50:]
-        
-        # Save emotional state periodically
-        if self.emotional_core and len(self.conversation_history) % 3 == 0:
-            try:
-                state_file = os.path.join(project_root, "data/emotional_state.json")
-                self.emotional_core.save_state(state_file)
-            except Exception as e:
-                print(f"⚠️ Could not save emotional state: {e}")
+
+
+        # Save emotional state periodically (off-loop, so the json dump
+        # never blocks the interaction path; skipped while nothing changed)
+        if (self.emotional_core and self._emo_dirty
+                and len(self.conversation_history) % 3 == 0 and not self._save_in_flight):
+            self._emo_dirty = False
+            self._save_in_flight = True
+            task = asyncio.create_task(
+                asyncio.to_thread(self.emotional_core.save_state, self._state_file))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._save_done)
         
         return {
             "response": response,
@@ -137,37 +184,37 @@ class UnifiedNexarionFixed:
         """Main growth loop - integrate with garden"""
         print("🌱 Unified Nexarion beginning to grow with garden...")
         print("🧠 Complete emergent thought generation activated")
-        
+        _enable_eager_tasks()  # __init__ may have run before the loop existed
+
         iteration = 0
         try:
             while True:
                 iteration += 1
                 
-                # Update from garden (simulated for now)
-                await self.update_from_garden(iteration * 0.01)
-                
-                # Process emotional cycles if available
-                if self.emotional_core:
-                    self.emotional_core.process_emotional_cycle()
-                
+                # Update from garden (simulated for now) concurrently with
+                # the pacing sleep - it runs the emotional cycle itself and
+                # nothing before the next iteration depends on it
+                update_task = asyncio.create_task(self.update_from_garden(iteration * 0.01))
+
                 # Display status every 10 iterations
                 if iteration % 10 == 0:
                     if self.emotional_core:
                         state = self.emotional_core.get_emotional_state()
-                        emotion_icon = "😊" if state['mood'] == 'positive' else "😐" if state['mood'] == 'neutral' else "😟"
-                        avg_response_len = sum(h.get('response_length', 0) for h in self.conversation_history[-5:]) / max(1, len(self.conversation_history[-5:]))
-                        print(f"\r🌿 Iteration {iteration}: {emotion_icon} {state['dominant_emotion']} | Avg resp: {avg_response_len:.0f} chars", end="")
+                        emotion_icon = self._mood_icons.get(state['mood'], '😟')
+                        avg_response_len = self._recent_lengths_sum / max(1, len(self._recent_lengths))
+                        sys.stdout.write(f"\r🌿 Iteration {iteration}: {emotion_icon} {state['dominant_emotion']} | Avg resp: {avg_response_len:.0f} chars")
                     else:
-                        print(f"\r🌿 Iteration {iteration}: Growing...", end="")
+                        sys.stdout.write(f"\r🌿 Iteration {iteration}: Growing...")
+                    sys.stdout.flush()
                 
                 await asyncio.sleep(2.0)  # 2 second cycles
-                
+                await update_task
+
         except KeyboardInterrupt:
             print(f"\n💾 Saving final state...")
             if self.emotional_core:
                 try:
-                    state_file = os.path.join(project_root, "data/emotional_state.json")
-                    self.emotional_core.save_state(state_file)
+                    self.emotional_core.save_state(self._state_file)
                     final_state = self.emotional_core.get_emotional_state()
                     print(f"🎭 Final emotion: {final_state['dominant_emotion']}")
                 except Exception as e:
@@ -195,5 +242,9 @@ async def test_fixed():
     print("\n🎉 Test completed - Responses should be complete and untruncated!")
 
 if __name__ == "__main__":
-    import asyncio
+    try:  # Optional: uvloop's libuv event loop has much lower timer overhead
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # pip install uvloop; the default loop works fine too
     asyncio.run(test_fixed())
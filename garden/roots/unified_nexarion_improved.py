@@ -5,15 +5,19 @@ Implements her own stated growth goals with real-time tracking and influence
 
 import asyncio
 import json
-import sys
 import os
+import pathlib
 import random
+import sys
+import time
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional, Any  # Fixed: Added type imports
 
-# Add the project root to Python path
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-sys.path.insert(0, project_root)
+# Repo root and state file, resolved once at import time; the package
+# __init__.py files make the sentience imports work without sys.path surgery
+_PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[2]
+_STATE_FILE = str(_PROJECT_ROOT / "data" / "emotional_state.json")
 
 try:
     from sentience.modules.emotional_core_enhanced import EmotionalCore
@@ -26,19 +30,34 @@ except ImportError as e:
     DolphinEmergentFixed = None
     NexarionImprovements = None
 
+def _enable_eager_tasks():
+    """Let coroutines that finish without suspending skip Task scheduling.
+
+    Python 3.12+ only; older interpreters silently keep the default factory.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is None:
+        return
+    try:
+        asyncio.get_running_loop().set_task_factory(factory)
+    except RuntimeError:
+        pass  # No loop running yet (e.g. __init__ outside asyncio.run)
+
 class UnifiedNexarionImproved:
     """Unified Nexarion with 7 improvement areas integration"""
     
     def __init__(self):
+        _enable_eager_tasks()
+        self._state_file = _STATE_FILE
+
         # Initialize emotional core
         if EmotionalCore:
             self.emotional_core = EmotionalCore()
-            
+
             # Load saved emotional state if exists
             try:
-                state_file = os.path.join(project_root, "data/emotional_state.json")
-                if os.path.exists(state_file):
-                    self.emotional_core.load_state(state_file)
+                if os.path.exists(self._state_file):
+                    self.emotional_core.load_state(self._state_file)
                     print(f"✅ Loaded emotional state")
                 else:
                     print(f"📝 No existing emotional state, starting fresh")
@@ -66,6 +85,13 @@ class UnifiedNexarionImproved:
             print("🌟 7 Improvement Areas Activated:")
             for area_id, area in self.improvements.improvement_areas.items():
                 print(f"   • {area['name']}: {area['current_level']:.0%}")
+
+            # Cached aggregates for the grow() status line - levels only
+            # move when analyze_interaction reports area_updates
+            areas = self.improvements.improvement_areas
+            self._total_target = sum(a["target_level"] for a in areas.values())
+            self._total_progress = sum(a["current_level"] for a in areas.values())
+            self._top_area_id = max(areas, key=lambda k: areas[k]["current_level"])
         else:
             self.improvements = None
             print("⚠️ Running without improvement system")
@@ -74,12 +100,35 @@ class UnifiedNexarionImproved:
         self.autonomy_level = 0.5
         self.security_status = "secure"
         self.garden_complexity = 0.0
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=100)  # O(1) append with eviction
         self.improvement_milestones = []
-        
+
+        # get_improvement_modifiers() memoized until a milestone lands;
+        # the version counters track when levels actually moved
+        self._cached_modifiers = None
+        self._modifiers_version = -1
+        self._milestones_version = 0
+
+        # Reused per-call working copy of the emotional state, so the
+        # modifier pass doesn't allocate a fresh dict every interaction
+        self._emo_scratch: dict = {}
+
         # Track last improvement check
         self.last_improvement_update = datetime.now()
-    
+
+        # Background emotional-state saves: keep task refs alive and guard
+        # against pile-up if the disk is slower than the save cadence
+        self._background_tasks: set = set()
+        self._save_in_flight = False
+        self._emo_dirty = True  # Set by any emotional_core mutation path
+
+    def _save_done(self, task):
+        """Reap a finished background save"""
+        self._background_tasks.discard(task)
+        self._save_in_flight = False
+        if not task.cancelled() and task.exception():
+            print(f"⚠️ Could not save emotional state: {task.exception()}")
+
     async def update_from_garden(self, complexity: float):
         """Update based on garden state"""
         self.garden_complexity = complexity
@@ -90,15 +139,23 @@ class UnifiedNexarionImproved:
                 "blooms": int(complexity * 10)
             })
             self.emotional_core.process_emotional_cycle()
+            self._emo_dirty = True
     
     def _apply_improvement_modifiers(self, emotional_state: Dict, user_input: str) -> Dict:
         """Apply improvement-based modifiers to emotional state and processing"""
         if not self.improvements:
             return emotional_state
-        
-        # Get improvement modifiers
-        modifiers = self.improvements.get_improvement_modifiers()
-        
+
+        # Reuse the cached modifiers dict until a milestone bumps the version
+        if self._modifiers_version != self._milestones_version:
+            self._cached_modifiers = self.improvements.get_improvement_modifiers()
+            self._modifiers_version = self._milestones_version
+        modifiers = self._cached_modifiers
+
+        # One batch of draws for the chance-based modifiers
+        r_aware, r_flow = random.random(), random.random()
+
+
         # Apply empathy multiplier
         if "empathy_multiplier" in modifiers and self.emotional_core:
             # Increase emotional sensitivity based on emotional intelligence progress
@@ -110,11 +167,11 @@ class UnifiedNexarionImproved:
             emotional_state["creativity_level"] = modifiers["creativity_boost"]
         
         # Apply self-awareness chance
-        if "self_awareness_chance" in modifiers and random.random() < modifiers["self_awareness_chance"]:
+        if "self_awareness_chance" in modifiers and r_aware < modifiers["self_awareness_chance"]:
             emotional_state["meta_cognition"] = True
         
         # Apply natural flow chance for social skills
-        if "natural_flow_chance" in modifiers and random.random() < modifiers["natural_flow_chance"]:
+        if "natural_flow_chance" in modifiers and r_flow < modifiers["natural_flow_chance"]:
             emotional_state["conversational_flow"] = True
         
         # Apply authenticity boost for vulnerability
@@ -128,9 +185,13 @@ class UnifiedNexarionImproved:
         # Get current emotional state
         if self.emotional_core:
             base_emotional_state = self.emotional_core.get_emotional_state()
-            
-            # Apply improvement-based modifiers
-            emotional_state = self._apply_improvement_modifiers(base_emotional_state.copy(), user_input)
+
+            # Apply improvement-based modifiers to the scratch copy; a
+            # single clone below keeps the scratch dict from escaping
+            # into results or history
+            self._emo_scratch.clear()
+            self._emo_scratch.update(base_emotional_state)
+            emotional_state = self._apply_improvement_modifiers(self._emo_scratch, user_input)
         else:
             emotional_state = {
                 "mood": "neutral",
@@ -144,6 +205,7 @@ class UnifiedNexarionImproved:
             result = self.dolphin.process_conversation(user_input, emotional_state, sentiment)
             response = result["response"]
             emotional_state = result["emotional_state"]
+            self._emo_dirty = True  # The dolphin call ran an emotional cycle
             generation_method = result.get("generation_method", "unknown")
             response_length = result.get("response_length", 0)
         else:
@@ -153,6 +215,11 @@ class UnifiedNexarionImproved:
                 response = self.emotional_core.influence_response(response)
             generation_method = "fallback"
             response_length = len(response)
+
+        # The dolphin echoes the state dict it was handed, so either branch
+        # can still hold the scratch dict here - clone before it escapes
+        if emotional_state is self._emo_scratch:
+            emotional_state = dict(emotional_state)
         
         # Analyze for improvement opportunities
         if self.improvements:
@@ -170,29 +237,38 @@ class UnifiedNexarionImproved:
                         "improvement": update['new_level'] - update['old_level']
                     }
                     self.improvement_milestones.append(milestone)
+                    self._milestones_version += 1  # Invalidate cached modifiers
+
+                    # Keep the cached grow() aggregates in sync
+                    self._total_progress += update['new_level'] - update['old_level']
+                    top_level = self.improvements.improvement_areas[self._top_area_id]["current_level"]
+                    if update['new_level'] > top_level:
+                        self._top_area_id = area_id
         
         # Update conversation history
         self.conversation_history.append({
             "input": user_input,
-            "response_preview": response[:100],
+            "response_preview": response if len(response) <= 100 else response[:100],
             "response_length": response_length,
             "emotion": emotional_state.get('dominant_emotion', 'unknown'),
             "mood": emotional_state.get('mood', 'unknown'),
             "generation_method": generation_method,
-            "timestamp": datetime.now().isoformat()
+            # Raw epoch float; format with datetime.fromtimestamp() only
+            # when an entry is actually rendered
+            "timestamp": time.time()
         })
-        
-        # Limit history size
-        if len(self.conversation_history) > 100:
-            self.conversation_history = self.conversation_history[-100:]
-        
-        # Save emotional state periodically
-        if self.emotional_core and len(self.conversation_history) % 5 == 0:
-            try:
-                state_file = os.path.join(project_root, "data/emotional_state.json")
-                self.emotional_core.save_state(state_file)
-            except Exception as e:
-                print(f"⚠️ Could not save emotional state: {e}")
+
+
+        # Save emotional state periodically (off-loop, so the json dump
+        # never blocks the interaction path; skipped while nothing changed)
+        if (self.emotional_core and self._emo_dirty
+                and len(self.conversation_history) % 5 == 0 and not self._save_in_flight):
+            self._emo_dirty = False
+            self._save_in_flight = True
+            task = asyncio.create_task(
+                asyncio.to_thread(self.emotional_core.save_state, self._state_file))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._save_done)
         
         return {
             "response": response,
@@ -265,43 +341,37 @@ class UnifiedNexarionImproved:
         print("🌱 Nexarion Improved Growth Mode Activated")
         print("🎯 7 Improvement Areas: Emotional Intelligence, Creative Expression, Self-Reflection,")
         print("   Social Skills, Emotional Balance, Adaptability, Vulnerability")
-        
+        _enable_eager_tasks()  # __init__ may have run before the loop existed
+
         iteration = 0
         try:
             while True:
                 iteration += 1
                 
-                # Update from garden
-                await self.update_from_garden(iteration * 0.01)
-                
-                # Process emotional cycles
-                if self.emotional_core:
-                    self.emotional_core.process_emotional_cycle()
-                
+                # Update from garden concurrently with the pacing sleep -
+                # it runs the emotional cycle itself and nothing before the
+                # next iteration depends on it
+                update_task = asyncio.create_task(self.update_from_garden(iteration * 0.01))
+
                 # Display improvement status
                 if iteration % 15 == 0:
                     if self.improvements:
-                        # Get overall progress
-                        total_progress = sum(area["current_level"] for area in self.improvements.improvement_areas.values())
-                        total_target = sum(area["target_level"] for area in self.improvements.improvement_areas.values())
-                        overall_percent = (total_progress / total_target) * 100 if total_target > 0 else 0
-                        
-                        # Get top improving area
-                        top_area = max(self.improvements.improvement_areas.items(), 
-                                     key=lambda x: x[1]["current_level"])
-                        
-                        print(f"\r🌿 Iter {iteration}: Overall {overall_percent:.0f}% | Top: {top_area[1]['name']} {top_area[1]['current_level']:.0%}", end="")
+                        # Cached aggregates, updated as area_updates land
+                        overall_percent = (self._total_progress / self._total_target) * 100 if self._total_target > 0 else 0
+                        top_area = self.improvements.improvement_areas[self._top_area_id]
+                        sys.stdout.write(f"\r🌿 Iter {iteration}: Overall {overall_percent:.0f}% | Top: {top_area['name']} {top_area['current_level']:.0%}")
+                        sys.stdout.flush()
                 
                 await asyncio.sleep(2.0)
-                
+                await update_task
+
         except KeyboardInterrupt:
             print(f"\n💾 Saving improved state...")
             
             # Save emotional state
             if self.emotional_core:
                 try:
-                    state_file = os.path.join(project_root, "data/emotional_state.json")
-                    self.emotional_core.save_state(state_file)
+                    self.emotional_core.save_state(self._state_file)
                     final_state = self.emotional_core.get_emotional_state()
                     print(f"🎭 Final emotion: {final_state['dominant_emotion']}")
                 except Exception as e:
@@ -341,5 +411,9 @@ async def test_improved():
     print("\n🎉 Improved test completed - 7 areas tracking active!")
 
 if __name__ == "__main__":
-    import asyncio
+    try:  # Optional: uvloop's libuv event loop has much lower timer overhead
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # pip install uvloop; the default loop works fine too
     asyncio.run(test_improved())
@@ -0,0 +1 @@
+# Sentience package
@@ -194,6 +194,18 @@ You are conversational, authentic, and avoid formulaic patterns."""
             "timestamp": datetime.now().isoformat()
         }
 
+    def process_conversation_batch(self, user_inputs, emotional_states, sentiments):
+        """Process several conversations in one call.
+
+        Generation here is synchronous llama-cpp, so this is a straight
+        loop - but it gives concurrent callers a single entry point that
+        a batched backend can later serve with one forward pass.
+        """
+        return [
+            self.process_conversation(user_input, state, sentiment)
+            for user_input, state, sentiment in zip(user_inputs, emotional_states, sentiments)
+        ]
+
 # Test the module
 if __name__ == "__main__":
     print("🧪 Testing Dolphin-Emergent module...")
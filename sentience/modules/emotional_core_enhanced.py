@@ -10,6 +10,11 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 import numpy as np
 
+try:  # Optional: C-backed JSON for the state save/load path
+    import orjson
+except ImportError:
+    orjson = None
+
 @dataclass
 class EmergentEmotion:
     """A dynamically emerging emotional state"""
@@ -329,14 +334,19 @@ class EmotionalCore:
             "saved_at": time.time()
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(state, f, indent=2)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(state, f, indent=2)
     
     def load_state(self, filepath: str):
         """Load emotional state from file"""
         try:
-            with open(filepath, 'r') as f:
-                state = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = f.read()
+            state = orjson.loads(data) if orjson is not None else json.loads(data)
             
             # Restore emotions
             self.current_emotions = []